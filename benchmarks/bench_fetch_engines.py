@@ -0,0 +1,81 @@
+"""
+Throughput of the thread and asyncio fetch engines, for one or more concurrent users.
+
+    python -m benchmarks.bench_fetch_engines [--urls 2000] [--latency 0.02] [--users 1 20]
+        [--requests-per-second 250]
+
+Requests go through the host rate limiter, so raise --requests-per-second to measure
+the engines themselves rather than the limit.
+"""
+
+import threading
+
+from benchmarks import mock_api
+from benchmarks.common import get_arguments, point_api_at, set_rate_limit, time_call
+
+
+def main():
+    args = get_arguments(
+        description=__doc__,
+        arguments=[
+            ("--urls", {"type": int, "default": 2000}),
+            ("--latency", {"type": float, "default": 0.02}),
+            ("--users", {"type": int, "nargs": "+", "default": [1, 20]}),
+            ("--requests-per-second", {"type": float, "default": None}),
+        ],
+    )
+
+    api_url = mock_api.start(latency=args.latency)
+    point_api_at(api_url)
+
+    from src.data_prep import load_data
+
+    if args.requests_per_second is not None:
+        set_rate_limit(args.requests_per_second)
+
+    # Checkouts from before the fetch_urls dispatcher fetch through the helpers
+    if hasattr(load_data, "fetch_urls"):
+        fetch = load_data.fetch_urls
+    else:
+        fetch = load_data.fetch_urls_concurrently_with_url
+
+    urls = [f"{api_url}/entry/{1000 + entry}/history/" for entry in range(args.urls)]
+
+    for users in args.users:
+        for mode in ["thread", "asyncio"]:
+            results = {}
+            threads_seen = [0]
+            done = threading.Event()
+
+            def watch():
+                while not done.wait(0.005):
+                    threads_seen[0] = max(threads_seen[0], threading.active_count())
+
+            def user(index):
+                results[index] = fetch(urls=urls[index::users], mode=mode)
+
+            def run():
+                threads = [
+                    threading.Thread(target=user, args=(index,))
+                    for index in range(users)
+                ]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+
+            watcher = threading.Thread(target=watch)
+            watcher.start()
+            seconds, _ = time_call(run)
+            done.set()
+            watcher.join()
+
+            fetched = sum(len(result) for result in results.values())
+            print(
+                f"{users:2d} users, {mode:7s}: {fetched / seconds:.0f} req/s, "
+                f"{fetched} fetched, peak {threads_seen[0]} threads"
+            )
+
+
+if __name__ == "__main__":
+    main()
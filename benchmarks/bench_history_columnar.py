@@ -0,0 +1,90 @@
+"""
+Time and peak memory to decode team histories and build the season history frame.
+
+    python -m benchmarks.bench_history_columnar [--teams 10000] [--seasons 15]
+"""
+
+import gc
+import json
+import time
+import tracemalloc
+
+from benchmarks.common import get_arguments, make_history, make_team_data
+
+
+def main():
+    args = get_arguments(
+        description=__doc__,
+        arguments=[
+            ("--teams", {"type": int, "default": 10000}),
+            ("--seasons", {"type": int, "default": 15}),
+        ],
+    )
+
+    from src.data_prep import load_data
+    from src.data_prep.reshape_data import summarise_season_history
+
+    team_data = make_team_data(args.teams)
+    payloads = [
+        json.dumps(
+            make_history(args.seasons, team["entry"], every_season=True)
+        ).encode()
+        for team in team_data
+    ]
+
+    try:
+        from src.data_prep.columnar import (
+            ColumnBuffer,
+            append_team_history,
+            history_schema,
+        )
+    except ImportError:
+        # Checkouts from before the columnar buffer keep one dict per team and season
+        def ingest():
+            history = []
+            for team, payload in zip(team_data, payloads):
+                history.extend(
+                    load_data.add_team_information(
+                        history=json.loads(payload), team=team
+                    )
+                )
+            return history
+
+    else:
+
+        def ingest():
+            buffer = ColumnBuffer(schema=history_schema)
+            for team, payload in zip(team_data, payloads):
+                append_team_history(
+                    buffer=buffer, history=json.loads(payload), team=team
+                )
+            return buffer.get_columns()
+
+    # Time without tracing first, as tracemalloc slows allocation heavy code
+    gc.collect()
+    start = time.perf_counter()
+    history = ingest()
+    ingest_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    season_history_df = summarise_season_history(season_history=history)
+    frame_seconds = time.perf_counter() - start
+    del history, season_history_df
+
+    gc.collect()
+    tracemalloc.start()
+    history = ingest()
+    _, ingest_peak = tracemalloc.get_traced_memory()
+    season_history_df = summarise_season_history(season_history=history)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(
+        f"{args.teams} teams x {args.seasons} seasons: "
+        f"ingest {ingest_seconds:.2f} s, frame {frame_seconds:.2f} s, "
+        f"peak after ingest {ingest_peak / 1e6:.0f} MB, peak {peak / 1e6:.0f} MB, "
+        f"{len(season_history_df)} rows"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+CPU time to join every team's history onto its team, with the fetching stubbed out.
+
+    python -m benchmarks.bench_history_enrichment [--teams 1000 2500 5000 10000] [--seasons 15]
+"""
+
+import collections
+import random
+import re
+
+from benchmarks.common import get_arguments, make_history, make_team_data, time_call
+
+# Teams on each synthetic standings page, as served by the API
+page_size = 50
+
+
+def make_responses(api_url, number_of_teams, number_of_seasons):
+    """
+    Returns the synthetic history/ responses of a league, keyed by URL, in the order
+    the requests would finish.
+    """
+    team_data = make_team_data(number_of_teams)
+    responses = {
+        f"{api_url}/entry/{team['entry']}/history/": make_history(
+            number_of_seasons, team["entry"], every_season=True
+        )
+        for team in team_data
+    }
+    urls = list(responses)
+    random.Random(0).shuffle(urls)
+    return team_data, {url: responses[url] for url in urls}
+
+
+def get_response(url, team_data, responses):
+    """
+    Serves a synthetic standings page, entry or history response for a URL.
+    """
+    page = re.search(r"page_standings=(\d+)", url)
+    if page:
+        first = (int(page.group(1)) - 1) * page_size
+        results = team_data[first : first + page_size]
+        return {
+            "standings": {
+                "has_next": first + page_size < len(team_data),
+                "results": [dict(team) for team in results],
+            }
+        }
+    if url.endswith("/history/"):
+        return responses[url]
+    return {"id": int(url.rstrip("/").rsplit("/", 1)[1])}
+
+
+def main():
+    args = get_arguments(
+        description=__doc__,
+        arguments=[
+            (
+                "--teams",
+                {"type": int, "nargs": "+", "default": [1000, 2500, 5000, 10000]},
+            ),
+            ("--seasons", {"type": int, "default": 15}),
+        ],
+    )
+
+    from src.data_prep import load_data
+
+    api_url = getattr(load_data, "api_url", "https://fantasy.premierleague.com/api")
+
+    for number_of_teams in args.teams:
+        team_data, responses = make_responses(api_url, number_of_teams, args.seasons)
+
+        if hasattr(load_data, "crawl_league"):
+
+            def fetch_urls(urls, on_result=None, **kwargs):
+                # Each URL is fetched once, however many times it is queued
+                queued = set(urls)
+                queue = collections.deque(urls)
+                while queue:
+                    url = queue.popleft()
+                    data = get_response(url, team_data, responses)
+                    for next_url in on_result(url, data):
+                        if next_url not in queued:
+                            queued.add(next_url)
+                            queue.append(next_url)
+                return []
+
+            load_data.fetch_urls = fetch_urls
+
+            def run():
+                return load_data.crawl_league(league_id=1, section="standings")[3]
+
+        else:
+            # Checkouts from before crawl_league join the histories in get_league_history
+            results = [{"url": url, "data": data} for url, data in responses.items()]
+            load_data.fetch_urls_concurrently_with_url = lambda urls, **kwargs: results
+
+            def run():
+                return load_data.get_league_history(team_data)
+
+        seconds, league_history = time_call(run)
+        if isinstance(league_history, dict):
+            rows = len(league_history["team_id"])
+        else:
+            rows = len(league_history)
+        print(
+            f"{number_of_teams:6d} teams x {args.seasons} seasons: "
+            f"{seconds:.2f} s, {rows} rows"
+        )
+
+
+if __name__ == "__main__":
+    main()
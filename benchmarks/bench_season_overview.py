@@ -0,0 +1,54 @@
+"""
+Time to build the season overview of a synthetic league, for several start years.
+
+    python -m benchmarks.bench_season_overview [--teams 500 10000] [--seasons 20]
+"""
+
+import warnings
+
+import pandas as pd
+
+from benchmarks.common import get_arguments, make_season_history, time_call
+
+
+def main():
+    args = get_arguments(
+        description=__doc__,
+        arguments=[
+            ("--teams", {"type": int, "nargs": "+", "default": [500, 10000]}),
+            ("--seasons", {"type": int, "default": 20}),
+            ("--repeat", {"type": int, "default": 5}),
+        ],
+    )
+    warnings.simplefilter("ignore")
+
+    from src.data_prep.output_league_seasons_history import (
+        filter_rehsaped_season_history,
+        get_season_overview,
+    )
+
+    team_ids = pd.DataFrame(
+        [{"id": team, "name": f"Club {team}"} for team in range(1, 21)]
+    )
+    first_year = 2024 - args.seasons
+
+    for number_of_teams in args.teams:
+        season_history_df, manager_information = make_season_history(
+            number_of_teams, args.seasons
+        )
+        for season_start_year in [first_year, first_year + args.seasons // 2, 2020]:
+            filtered_df = filter_rehsaped_season_history(
+                season_start_year, season_history_df
+            )
+            seconds, season_overview = time_call(
+                lambda: get_season_overview(filtered_df, manager_information, team_ids),
+                repeat=args.repeat,
+            )
+            print(
+                f"{number_of_teams:6d} teams, from {season_start_year}: "
+                f"{seconds * 1000:.1f} ms, {len(season_overview)} rows"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""
+Connections opened and wall time of a whole league build against a stand-in API.
+
+    python -m benchmarks.bench_session [--teams 500] [--latency 0.005]
+        [--requests-per-second 250]
+"""
+
+from benchmarks import mock_api
+from benchmarks.common import get_arguments, point_api_at, set_rate_limit, time_call
+
+
+def main():
+    args = get_arguments(
+        description=__doc__,
+        arguments=[
+            ("--teams", {"type": int, "default": 500}),
+            ("--latency", {"type": float, "default": 0.005}),
+            ("--requests-per-second", {"type": float, "default": None}),
+        ],
+    )
+
+    api_url = mock_api.start(latency=args.latency, n_managers=args.teams)
+    point_api_at(api_url)
+    if args.requests_per_second is not None:
+        set_rate_limit(args.requests_per_second)
+
+    from src.app_utility.create_output_tables import get_team_and_league_data
+
+    seconds, league_build = time_call(lambda: get_team_and_league_data(league_id=1))
+    stats = mock_api.get_stats(api_url)
+
+    print(
+        f"{args.teams} teams, {args.latency * 1000:.0f} ms latency: "
+        f"{stats['connections']} connections, "
+        f"{stats['requests']} requests, {seconds:.2f} s"
+    )
+
+
+if __name__ == "__main__":
+    main()
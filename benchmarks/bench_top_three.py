@@ -0,0 +1,42 @@
+"""
+Time to build the top-three-per-season table of long-running synthetic leagues.
+
+    python -m benchmarks.bench_top_three [--teams 20 500 10000] [--seasons 30]
+"""
+
+import warnings
+
+from benchmarks.common import get_arguments, make_season_history, time_call
+
+
+def main():
+    args = get_arguments(
+        description=__doc__,
+        arguments=[
+            ("--teams", {"type": int, "nargs": "+", "default": [20, 500, 10000]}),
+            ("--seasons", {"type": int, "default": 30}),
+            ("--repeat", {"type": int, "default": 10}),
+        ],
+    )
+    warnings.simplefilter("ignore")
+
+    from src.data_prep.output_league_seasons_history import (
+        get_seasons_by_top_three_teams,
+    )
+
+    for number_of_teams in args.teams:
+        season_history_df, _ = make_season_history(
+            number_of_teams, args.seasons, every_season=True
+        )
+        seconds, seasons_top_three = time_call(
+            lambda: get_seasons_by_top_three_teams(season_history_df),
+            repeat=args.repeat,
+        )
+        print(
+            f"{number_of_teams:6d} teams x {args.seasons} seasons: "
+            f"{seconds * 1000:.1f} ms, {len(seasons_top_three)} rows"
+        )
+
+
+if __name__ == "__main__":
+    main()
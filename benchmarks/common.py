@@ -0,0 +1,174 @@
+import argparse
+import os
+import random
+import sys
+import time
+
+# The checkout benchmarked by default, the one holding this directory
+repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def get_arguments(description, arguments=()):
+    """
+    Parses the command line of a benchmark.
+
+    Every benchmark takes --root, the checkout whose src package is measured, so an
+    earlier revision can be measured by pointing it at a git worktree, e.g.
+    git worktree add /tmp/before <revision>.
+
+    Parameters
+    ----------
+    description : str
+        What the benchmark measures.
+    arguments : iterable of tuple, optional
+        Further (name, kwargs) arguments for argparse.
+
+    Returns
+    -------
+    argparse.Namespace
+        The parsed arguments, with the root checkout importable.
+    """
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("--root", default=repo_root, help="checkout to benchmark")
+    for name, kwargs in arguments:
+        parser.add_argument(name, **kwargs)
+    args = parser.parse_args()
+
+    sys.path.insert(0, os.path.abspath(args.root))
+    return args
+
+
+def point_api_at(api_url):
+    """
+    Points the root checkout's API fetches at a stand-in API, with no response cache.
+
+    Checkouts from before api_url was a module constant fetch with requests.get, so
+    their requests are redirected instead.
+
+    Parameters
+    ----------
+    api_url : str
+        The base URL of the stand-in API.
+    """
+    from src.data_prep import load_data
+
+    if hasattr(load_data, "api_url"):
+        load_data.api_url = api_url
+    else:
+        import requests
+
+        get = requests.get
+        requests.get = lambda url, *args, **kwargs: get(
+            url.replace("https://fantasy.premierleague.com/api", api_url),
+            *args,
+            **kwargs,
+        )
+
+    try:
+        from src.data_prep import response_cache
+    except ImportError:
+        return
+    response_cache.cache_path = None
+
+
+def set_rate_limit(requests_per_second):
+    """
+    Sets the requests per second and burst the root checkout allows each host.
+
+    Checkouts from before the host rate limiter are unaffected.
+    """
+    try:
+        from src.data_prep import rate_limit
+    except ImportError:
+        return
+    rate_limit.requests_per_second = requests_per_second
+    rate_limit.burst = requests_per_second
+
+
+def time_call(function, repeat=1):
+    """
+    Times a call, keeping the fastest of repeat runs.
+
+    Returns
+    -------
+    seconds : float
+        The fastest run.
+    result : object
+        The result of the last run.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def make_team_data(number_of_teams):
+    """
+    Returns synthetic standings entries for a league.
+    """
+    return [
+        {
+            "entry": 10000 + team,
+            "entry_name": f"Team name {team}",
+            "player_name": f"Manager name {team}",
+        }
+        for team in range(number_of_teams)
+    ]
+
+
+def make_history(number_of_seasons, seed, every_season=False):
+    """
+    Returns a synthetic history/ response, ending with the 2023/24 season.
+
+    Unless every_season is set, each team joins in a random one of the seasons.
+    """
+    rnd = random.Random(seed)
+    season_names = [
+        f"{year}/{str(year + 1)[2:]}" for year in range(2024 - number_of_seasons, 2024)
+    ]
+    if not every_season:
+        season_names = season_names[rnd.randint(0, number_of_seasons - 1) :]
+    past = [
+        {
+            "season_name": season_name,
+            "total_points": rnd.randint(1500, 2600),
+            "rank": rnd.randint(1, 9_000_000),
+        }
+        for season_name in season_names
+    ]
+    return {"current": [], "past": past, "chips": []}
+
+
+def make_season_history(number_of_teams, number_of_seasons, every_season=False):
+    """
+    Returns a synthetic league as the summarised season history and manager information.
+    """
+    from src.data_prep.reshape_data import summarise_season_history
+
+    records = []
+    for team in make_team_data(number_of_teams):
+        history = make_history(number_of_seasons, team["entry"], every_season)
+        for season in history["past"]:
+            records.append(
+                {
+                    **season,
+                    "team_id": team["entry"],
+                    "team_name": team["entry_name"],
+                    "manager_name": team["player_name"],
+                }
+            )
+    season_history_df = summarise_season_history(season_history=records)
+
+    manager_information = [
+        {
+            "entry": 10000 + team,
+            "summary_overall_rank": team + 1,
+            "player_region_iso_code_long": "ENG",
+            "favourite_team": team % 20 + 1,
+        }
+        for team in range(number_of_teams)
+    ]
+
+    return season_history_df, manager_information
@@ -0,0 +1,277 @@
+import atexit
+import gzip
+import json
+import random
+import re
+import socket
+import subprocess
+import sys
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Behaviour of the stand-in API, changed over HTTP with /_config?key=value&...
+config = {
+    "latency": 0.0,
+    "n_managers": 500,
+    "n_seasons": 15,
+    "started": True,
+    "fail_rate": 0.0,
+    "status_429_rate": 0.0,
+    "stall_rate": 0.0,
+    "stall": 0.0,
+    "page_size": 50,
+}
+
+# Connections opened and requests served since the last reset, also at /_stats
+stats = {"connections": 0, "requests": 0}
+_stats_lock = threading.Lock()
+
+
+def reset_stats():
+    """
+    Sets the connection and request counts back to zero.
+    """
+    with _stats_lock:
+        stats["connections"] = 0
+        stats["requests"] = 0
+
+
+def get_season_names(number_of_seasons):
+    """
+    Returns the names of the most recent seasons, oldest first, e.g. "2022/23".
+    """
+    return [
+        f"{year}/{str(year + 1)[2:4]}"
+        for year in range(2023 - number_of_seasons + 1, 2024)
+    ]
+
+
+def get_bootstrap():
+    events = [
+        {
+            "id": event,
+            "deadline_time": f"2024-08-{(event % 28) + 1:02d}T10:00:00Z",
+            "finished": event < 10,
+            "is_current": event == 38 and config["started"],
+        }
+        for event in range(1, 39)
+    ]
+    teams = [{"id": team, "name": f"Club {team}"} for team in range(1, 21)]
+    return {"events": events, "teams": teams, "elements": [{"x": "y" * 50}] * 2000}
+
+
+def get_entry(entry):
+    return {
+        "id": entry,
+        "summary_overall_rank": entry * 17 % 100000 + 1,
+        "player_region_iso_code_long": "ENG",
+        "favourite_team": (entry % 21) or None,
+    }
+
+
+def get_history(entry):
+    rnd = random.Random(entry)
+    season_names = get_season_names(config["n_seasons"])
+    start = rnd.randint(0, len(season_names) - 1)
+    past = [
+        {
+            "season_name": season_name,
+            "total_points": rnd.randint(1500, 2700),
+            "rank": rnd.randint(1, 9000000),
+        }
+        for season_name in season_names[start:]
+    ]
+    return {"current": [], "past": past, "chips": []}
+
+
+def get_standings(page, new_entries):
+    first = (page - 1) * config["page_size"]
+    last = min(config["n_managers"], first + config["page_size"])
+
+    results = []
+    for position in range(first, last):
+        entry = 1000 + position
+        if new_entries:
+            results.append(
+                {
+                    "entry": entry,
+                    "entry_name": f"Team {entry}",
+                    "player_first_name": "Mgr",
+                    "player_last_name": str(entry),
+                    "joined_time": "x",
+                }
+            )
+        else:
+            results.append(
+                {
+                    "id": entry,
+                    "event_total": 50,
+                    "player_name": f"Mgr {entry}",
+                    "rank": position + 1,
+                    "last_rank": position + 1,
+                    "rank_sort": position + 1,
+                    "total": 1000 - position,
+                    "entry": entry,
+                    "entry_name": f"Team {entry}",
+                }
+            )
+
+    block = {"has_next": last < config["n_managers"], "page": page, "results": results}
+    empty = {"has_next": False, "page": 1, "results": []}
+    standings = {"league": {"id": 1, "name": "The Mock League"}}
+    standings["new_entries"] = block if new_entries else empty
+    standings["standings"] = empty if new_entries else block
+    return standings
+
+
+class Handler(BaseHTTPRequestHandler):
+    """
+    Serves the FPL API endpoints the app reads, with configurable latency and faults.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    # Send each response as soon as it is written, rather than waiting on the
+    # client's delayed ACK of the headers
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        with _stats_lock:
+            stats["connections"] += 1
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        path = self.path
+        if path.startswith("/_stats"):
+            return self.send(200, stats)
+        if path.startswith("/_config?"):
+            for item in path.split("?", 1)[1].split("&"):
+                key, value = item.split("=")
+                if isinstance(config[key], bool):
+                    config[key] = value == "1"
+                else:
+                    config[key] = type(config[key])(float(value))
+            reset_stats()
+            return self.send(200, config)
+
+        with _stats_lock:
+            stats["requests"] += 1
+        if config["latency"]:
+            time.sleep(config["latency"])
+        if config["stall_rate"] and random.random() < config["stall_rate"]:
+            time.sleep(config["stall"])
+        if config["status_429_rate"] and random.random() < config["status_429_rate"]:
+            return self.send(429, {"detail": "throttled"})
+        if config["fail_rate"] and random.random() < config["fail_rate"]:
+            return self.send(503, {"detail": "unavailable"})
+
+        if re.match(r"/api/bootstrap-static/", path):
+            return self.send(200, get_bootstrap())
+        match = re.match(r"/api/leagues-classic/\d+/standings/\?(.*)", path)
+        if match:
+            query = dict(item.split("=") for item in match.group(1).split("&"))
+            if config["started"]:
+                return self.send(
+                    200, get_standings(int(query.get("page_standings", 1)), False)
+                )
+            return self.send(
+                200, get_standings(int(query.get("page_new_entries", 1)), True)
+            )
+        match = re.match(r"/api/entry/(\d+)/history/", path)
+        if match:
+            return self.send(200, get_history(int(match.group(1))))
+        match = re.match(r"/api/entry/(\d+)/", path)
+        if match:
+            return self.send(200, get_entry(int(match.group(1))))
+        return self.send(404, {"detail": "Not found."})
+
+    def send(self, status, body):
+        content = json.dumps(body).encode()
+        compress = "gzip" in (self.headers.get("Accept-Encoding") or "")
+        if compress:
+            content = gzip.compress(content, compresslevel=1)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        if compress:
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        try:
+            self.wfile.write(content)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+
+def serve(port):
+    """
+    Serves the stand-in API on a port until the process is stopped.
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+    server.daemon_threads = True
+    server.request_queue_size = 1024
+    server.serve_forever()
+
+
+def get_free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start(**settings):
+    """
+    Starts the stand-in API in a child process, so its threads and CPU time are not
+    counted against the code being benchmarked.
+
+    Parameters
+    ----------
+    **settings
+        Values of config to start with, e.g. latency=0.005.
+
+    Returns
+    -------
+    api_url : str
+        The base URL to point load_data.api_url at.
+    """
+    port = get_free_port()
+    process = subprocess.Popen([sys.executable, "-m", "benchmarks.mock_api", str(port)])
+    atexit.register(process.terminate)
+
+    base_url = f"http://127.0.0.1:{port}"
+    for _ in range(100):
+        try:
+            urllib.request.urlopen(f"{base_url}/_stats").read()
+            break
+        except OSError:
+            time.sleep(0.05)
+
+    configure(base_url, **settings)
+    return f"{base_url}/api"
+
+
+def configure(base_url, **settings):
+    """
+    Changes the config of a running stand-in API and resets its stats.
+    """
+    query = "&".join(
+        f"{key}={int(value) if isinstance(value, bool) else value}"
+        for key, value in settings.items()
+    )
+    urllib.request.urlopen(f"{base_url}/_config?{query}").read()
+
+
+def get_stats(api_url):
+    """
+    Returns the connections opened and requests served since the stats were reset.
+    """
+    base_url = api_url.rsplit("/api", 1)[0]
+    return json.loads(urllib.request.urlopen(f"{base_url}/_stats").read())
+
+
+if __name__ == "__main__":
+    serve(port=int(sys.argv[1]))
@@ -1,20 +1,35 @@
+import time
+
 import dash
 from dash import dcc, html
 import dash_bootstrap_components as dbc
 from dash.dependencies import Input, Output, State
+from dash.exceptions import PreventUpdate
 import dash_table
 import pandas as pd
 
 
-from src.app_utility.app_tools import get_most_recent_august_start, remove_starting_the
+from src.app_utility.app_tools import (
+    get_most_recent_august_start,
+    remove_starting_the,
+    get_league_status_message,
+    get_table_page,
+    get_team_options,
+)
 from src.app_utility.create_output_tables import (
-    get_team_and_league_data,
-    get_team_and_league_data_filtered_summarised,
+    load_league_dataset,
+    get_league_output_shared,
 )
+from src.data_prep.output_league_seasons_history import get_team_comparison
+from src.data_prep.output_league_summary import get_league_name
 
 # Initialize the Dash app
 external_stylesheets = [dbc.themes.BOOTSTRAP]
-app = dash.Dash(__name__, external_stylesheets=external_stylesheets)
+app = dash.Dash(
+    __name__,
+    external_stylesheets=external_stylesheets,
+    suppress_callback_exceptions=True,
+)
 
 # Set the title of the app
 app.title = "FPL - League History"
@@ -30,6 +45,23 @@ style_cell_tables = {
 }
 style_header_tables = {"fontWeight": "bold"}
 
+# Rows sent to the browser per page of the paged tables
+table_page_size = 25
+
+# Tables paged, sorted and filtered on the server, by the ID of their DataTable, with
+# the league output they show (see get_league_output)
+paged_tables = {
+    "season-overview-data": "season_overview_output",
+    "current-season-data": "season_current",
+    "previous-seasons-data": "season_history",
+    "all-time-data": "all_time_table",
+}
+
+# Teams compared side by side when a league is loaded, and the most teams offered by
+# the team search at once
+team_comparison_default = 3
+team_options_limit = 20
+
 # Pre Processing
 latest_season_start = get_most_recent_august_start()
 
@@ -76,6 +108,9 @@ select_inputs = html.Div(
                             min=0,
                             max=99999999,
                             step=1,
+                            # Load once the ID is entered (Enter or leaving the box),
+                            # not on every keystroke
+                            debounce=True,
                             style={"width": "100%"},
                         ),
                     ],
@@ -196,6 +231,79 @@ def table_dash_format(
     return format_item
 
 
+def paged_table_dash_format(id_table, df):
+    """
+    Generates a DataTable showing the first page of a table, whose other pages are
+    sorted, filtered and sent by the server as they are viewed.
+
+    Parameters:
+    -----------
+    id_table : str
+        The ID of the DataTable, one of paged_tables.
+    df : pandas.DataFrame
+        The full table.
+
+    Returns:
+    --------
+    format_item : dash_table.DataTable
+        The DataTable holding the first page of df.
+    """
+    data, page_count = get_table_page(df=df, page_current=0, page_size=table_page_size)
+
+    columns = []
+    for column in df.columns:
+        column_format = {"name": column, "id": column}
+        if pd.api.types.is_numeric_dtype(df[column]):
+            column_format["type"] = "numeric"
+        columns.append(column_format)
+
+    format_item = dash_table.DataTable(
+        id=id_table,
+        columns=columns,
+        data=data,
+        style_cell=style_cell_tables,
+        style_header=style_header_tables,
+        page_action="custom",
+        page_current=0,
+        page_size=table_page_size,
+        page_count=page_count,
+        sort_action="custom",
+        sort_mode="multi",
+        sort_by=[],
+        filter_action="custom",
+        filter_query="",
+    )
+    return format_item
+
+
+def team_comparison_dash_format(df, team_ids):
+    """
+    Generates a DataTable setting the summary statistics of a few teams side by side.
+
+    Parameters:
+    -----------
+    df : pandas.DataFrame
+        The season overview, one row per team.
+    team_ids : list of int
+        The IDs of the teams to compare.
+
+    Returns:
+    --------
+    format_item : dash_table.DataTable
+        The DataTable comparing the teams.
+    """
+    team_comparison = get_team_comparison(df=df, team_ids=team_ids)
+
+    format_item = dash_table.DataTable(
+        columns=[{"name": i, "id": i} for i in team_comparison.columns],
+        data=team_comparison.to_dict(orient="records"),
+        style_cell=style_cell_tables,
+        style_header=style_header_tables,
+        export_format="csv",
+    )
+    return format_item
+
+
 league_summary_table = table_dash_format(
     id_header="league-name",
     id_table="summary-kpis",
@@ -261,9 +369,20 @@ container = dbc.Card(
     style={"background-color": "#f8f9fa", "margin": "10px", "max-width": "700px"},
 )
 
+# Warning shown when the league data is incomplete, and the key of the loaded league
+# dataset held on the server
+league_status_message = dcc.Loading(
+    type="circle",
+    children=[
+        html.Div(id="league-status", style={"max-width": "700px", "margin": "10px"}),
+        dcc.Store(id="league-dataset"),
+    ],
+)
+
 app.layout = html.Div(
     children=[
         container,
+        league_status_message,
         league_summary_table,
         winner_table,
         list_of_champions_table,
@@ -282,33 +401,71 @@ app.layout = html.Div(
 
 @app.callback(
     [
-        Output(component_id="league-name", component_property="children"),
-        Output(component_id="summary-kpis", component_property="children"),
-        Output(component_id="winner-data-header", component_property="children"),
-        Output(component_id="winner-data", component_property="children"),
-        Output(component_id="list-of-champions-header", component_property="children"),
-        Output(component_id="list-of-champions", component_property="children"),
-        Output(component_id="all-time-table-header", component_property="children"),
-        Output(component_id="all-time-table", component_property="children"),
-        Output(component_id="previous-seasons-header", component_property="children"),
-        Output(component_id="previous-seasons", component_property="children"),
-        Output(component_id="season-overview-header", component_property="children"),
-        Output(component_id="season-overview", component_property="children"),
-        Output(component_id="current-season-header", component_property="children"),
-        Output(component_id="current-season", component_property="children"),
+        Output(component_id="league-dataset", component_property="data"),
+        Output(component_id="league-status", component_property="children"),
     ],
     Input(component_id="league-id", component_property="value"),
-    Input(component_id="year-select", component_property="value"),
     prevent_initial_call=True,
 )
-def dash_get_team_and_league_data(league_id, season_start_year):
+def dash_load_league_dataset(league_id):
     """
-    This function retrieves various data elements related to a specific league for display on a dashboard.
+    Loads the data for a league into the server side store when the league ID changes.
 
     Parameters:
     -----------
     league_id : int
         The ID of the league.
+
+    Returns:
+    --------
+    league_dataset : dict
+        The key of the loaded league dataset, with the time it was loaded so loading
+        the same league again still updates the tables, or None if the league could
+        not be loaded.
+    league_status_dash : dbc.Alert or str
+        Warning shown when the league data is incomplete, or the error shown when the
+        league could not be loaded.
+    """
+    if league_id is None:
+        raise PreventUpdate
+
+    try:
+        league_status = load_league_dataset(league_id=league_id)[9]
+    except ValueError as error:
+        return None, dbc.Alert(str(error), color="danger")
+
+    league_status_message = get_league_status_message(league_status=league_status)
+    if league_status_message:
+        league_status_dash = dbc.Alert(league_status_message, color="warning")
+    else:
+        league_status_dash = ""
+
+    league_dataset = {"league_id": league_id, "loaded_at": time.time()}
+
+    return league_dataset, league_status_dash
+
+
+@app.callback(
+    [
+        Output(component_id="league-name", component_property="children"),
+        Output(component_id="summary-kpis", component_property="children"),
+    ],
+    Input(component_id="league-dataset", component_property="data"),
+    Input(component_id="year-select", component_property="value"),
+    prevent_initial_call=True,
+)
+def dash_get_league_summary(league_dataset, season_start_year):
+    """
+    Shows the name and summary key performance indicators (KPIs) of the league.
+
+    Each section of the dashboard has a callback of its own, reading its tables from
+    the league dataset loaded by dash_load_league_dataset, so every section is shown as
+    soon as it is ready and only the tables it shows are computed.
+
+    Parameters:
+    -----------
+    league_dataset : dict
+        The key of the loaded league dataset.
     season_start_year : int
         The starting year of the season.
 
@@ -318,65 +475,17 @@ def dash_get_team_and_league_data(league_id, season_start_year):
         The name of the league.
     league_summary_kpis_dash : dash_table.DataTable
         DataTable containing summary key performance indicators (KPIs) for the league.
-    titles_won_summary_output_dash_header : str
-        Header for the titles won summary output table.
-    titles_won_summary_output_dash : dash_table.DataTable
-        DataTable containing information about titles won by the league participants.
-    seasons_top_three_output_dash_header : str
-        Header for the seasons top three output table.
-    seasons_top_three_output_dash : dash_table.DataTable
-        DataTable containing information about the top three participants in each season.
-    all_time_table_output_dash_header : str
-        Header for the all-time league table output table.
-    all_time_table_output_dash : dash_table.DataTable
-        DataTable containing the all-time league table.
-    season_history_df_output_dash_header : str
-        Header for the season history output table.
-    season_history_df_output_dash : dash_table.DataTable
-        DataTable containing information about previous seasons of the league.
-    season_overview_output_dash_header : str
-        Header for the season overview output table.
-    season_overview_output_dash : dash_table.DataTable
-        DataTable containing summary statistics for each team across seasons.
-    season_current_df_output_dash_header : str
-        Header for the current season output table.
-    season_current_df_output_dash : dash_table.DataTable
-        DataTable containing information about the current season of the league.
     """
+    if league_dataset is None:
+        raise PreventUpdate
 
-    (
-        league_data,
-        manager_information,
-        team_ids,
-        final_gw_finished,
-        season_history,
-        season_current_df,
-        season_history_df,
-        current_gamekweek,
-        team_data,
-    ) = get_team_and_league_data(league_id=league_id)
-
-    (
-        league_name,
-        league_summary_kpis,
-        seasons_top_three_output,
-        titles_won_summary_output,
-        season_overview_output,
-        season_current_df_output,
-        season_history_df_output,
-        all_time_table_output,
-    ) = get_team_and_league_data_filtered_summarised(
-        league_data=league_data,
-        manager_information=manager_information,
-        team_ids=team_ids,
-        season_current_df=season_current_df,
-        season_history_df=season_history_df,
+    league_build, (league_name, league_summary_kpis) = get_league_output_shared(
+        league_id=league_dataset["league_id"],
+        output="league_summary",
         season_start_year=season_start_year[0],
-        team_data=team_data,
     )
 
-    # league_summary_kpis.reset_index(inplace=True)
-    league_summary_kpis.reset_index(inplace=True)
+    league_summary_kpis = league_summary_kpis.reset_index()
     league_summary_kpis.columns = ["", league_name]
     league_summary_kpis_dash = dash_table.DataTable(
         id="df",
@@ -386,6 +495,46 @@ def dash_get_team_and_league_data(league_id, season_start_year):
         style_header=style_header_tables,
         export_format="csv",
     )
+
+    return league_name, league_summary_kpis_dash
+
+
+@app.callback(
+    [
+        Output(component_id="winner-data-header", component_property="children"),
+        Output(component_id="winner-data", component_property="children"),
+    ],
+    Input(component_id="league-dataset", component_property="data"),
+    Input(component_id="year-select", component_property="value"),
+    prevent_initial_call=True,
+)
+def dash_get_titles_won_summary(league_dataset, season_start_year):
+    """
+    Shows the number of titles won by each team.
+
+    Parameters:
+    -----------
+    league_dataset : dict
+        The key of the loaded league dataset.
+    season_start_year : int
+        The starting year of the season.
+
+    Returns:
+    --------
+    titles_won_summary_output_dash_header : str
+        Header for the titles won summary output table.
+    titles_won_summary_output_dash : dash_table.DataTable
+        DataTable containing information about titles won by the league participants.
+    """
+    if league_dataset is None:
+        raise PreventUpdate
+
+    league_build, titles_won_summary_output = get_league_output_shared(
+        league_id=league_dataset["league_id"],
+        output="titles_won_summary",
+        season_start_year=season_start_year[0],
+    )
+
     titles_won_summary_output_dash_header = "Champions"
     titles_won_summary_output_dash = dash_table.DataTable(
         id="df",
@@ -396,6 +545,45 @@ def dash_get_team_and_league_data(league_id, season_start_year):
         export_format="csv",
     )
 
+    return titles_won_summary_output_dash_header, titles_won_summary_output_dash
+
+
+@app.callback(
+    [
+        Output(component_id="list-of-champions-header", component_property="children"),
+        Output(component_id="list-of-champions", component_property="children"),
+    ],
+    Input(component_id="league-dataset", component_property="data"),
+    Input(component_id="year-select", component_property="value"),
+    prevent_initial_call=True,
+)
+def dash_get_seasons_top_three(league_dataset, season_start_year):
+    """
+    Shows the top three teams of each season.
+
+    Parameters:
+    -----------
+    league_dataset : dict
+        The key of the loaded league dataset.
+    season_start_year : int
+        The starting year of the season.
+
+    Returns:
+    --------
+    seasons_top_three_output_dash_header : str
+        Header for the seasons top three output table.
+    seasons_top_three_output_dash : dash_table.DataTable
+        DataTable containing information about the top three participants in each season.
+    """
+    if league_dataset is None:
+        raise PreventUpdate
+
+    league_build, seasons_top_three_output = get_league_output_shared(
+        league_id=league_dataset["league_id"],
+        output="seasons_top_three",
+        season_start_year=season_start_year[0],
+    )
+
     seasons_top_three_output_dash_header = "List of Champions"
     seasons_top_three_output_dash = dash_table.DataTable(
         id="df",
@@ -406,42 +594,217 @@ def dash_get_team_and_league_data(league_id, season_start_year):
         export_format="csv",
     )
 
+    return seasons_top_three_output_dash_header, seasons_top_three_output_dash
+
+
+@app.callback(
+    [
+        Output(component_id="all-time-table-header", component_property="children"),
+        Output(component_id="all-time-table", component_property="children"),
+    ],
+    Input(component_id="league-dataset", component_property="data"),
+    Input(component_id="year-select", component_property="value"),
+    prevent_initial_call=True,
+)
+def dash_get_all_time_table(league_dataset, season_start_year):
+    """
+    Shows the first page of the all-time league table.
+
+    Parameters:
+    -----------
+    league_dataset : dict
+        The key of the loaded league dataset.
+    season_start_year : int
+        The starting year of the season.
+
+    Returns:
+    --------
+    all_time_table_output_dash_header : str
+        Header for the all-time league table output table.
+    all_time_table_output_dash : dash_table.DataTable
+        DataTable containing the all-time league table.
+    """
+    if league_dataset is None:
+        raise PreventUpdate
+
+    league_build, all_time_table_output = get_league_output_shared(
+        league_id=league_dataset["league_id"],
+        output="all_time_table",
+        season_start_year=season_start_year[0],
+    )
+
+    league_name = get_league_name(league_data=league_build[0])
     league_name_starting_the_removed = remove_starting_the(text=league_name)
     all_time_table_output_dash_header = (
         f"All-time {league_name_starting_the_removed} table"
     )
-    all_time_table_output_dash = dash_table.DataTable(
-        id="df",
-        columns=[{"name": i, "id": i} for i in all_time_table_output.columns],
-        data=all_time_table_output.to_dict(orient="records"),
-        style_cell=style_cell_tables,
-        style_header=style_header_tables,
-        export_format="csv",
+    all_time_table_output_dash = paged_table_dash_format(
+        id_table="all-time-data", df=all_time_table_output
     )
 
+    return all_time_table_output_dash_header, all_time_table_output_dash
+
+
+@app.callback(
+    [
+        Output(component_id="previous-seasons-header", component_property="children"),
+        Output(component_id="previous-seasons", component_property="children"),
+    ],
+    Input(component_id="league-dataset", component_property="data"),
+    Input(component_id="year-select", component_property="value"),
+    prevent_initial_call=True,
+)
+def dash_get_season_history(league_dataset, season_start_year):
+    """
+    Shows the first page of the previous seasons of the league.
+
+    Parameters:
+    -----------
+    league_dataset : dict
+        The key of the loaded league dataset.
+    season_start_year : int
+        The starting year of the season.
+
+    Returns:
+    --------
+    season_history_df_output_dash_header : str
+        Header for the season history output table.
+    season_history_df_output_dash : dash_table.DataTable
+        DataTable containing information about previous seasons of the league.
+    """
+    if league_dataset is None:
+        raise PreventUpdate
+
+    league_build, season_history_df_output = get_league_output_shared(
+        league_id=league_dataset["league_id"],
+        output="season_history",
+        season_start_year=season_start_year[0],
+    )
+
+    league_name = get_league_name(league_data=league_build[0])
+    league_name_starting_the_removed = remove_starting_the(text=league_name)
     season_history_df_output_dash_header = (
         f"Previous {league_name_starting_the_removed} seasons"
     )
-    season_history_df_output_dash = dash_table.DataTable(
-        id="df",
-        columns=[{"name": i, "id": i} for i in season_history_df_output.columns],
-        data=season_history_df_output.to_dict(orient="records"),
-        style_cell=style_cell_tables,
-        style_header=style_header_tables,
-        export_format="csv",
+    season_history_df_output_dash = paged_table_dash_format(
+        id_table="previous-seasons-data", df=season_history_df_output
+    )
+
+    return season_history_df_output_dash_header, season_history_df_output_dash
+
+
+@app.callback(
+    [
+        Output(component_id="season-overview-header", component_property="children"),
+        Output(component_id="season-overview", component_property="children"),
+    ],
+    Input(component_id="league-dataset", component_property="data"),
+    Input(component_id="year-select", component_property="value"),
+    prevent_initial_call=True,
+)
+def dash_get_season_overview(league_dataset, season_start_year):
+    """
+    Shows the summary statistics of each team, with a search to compare teams.
+
+    Parameters:
+    -----------
+    league_dataset : dict
+        The key of the loaded league dataset.
+    season_start_year : int
+        The starting year of the season.
+
+    Returns:
+    --------
+    season_overview_output_dash_header : str
+        Header for the season overview output table.
+    season_overview_output_dash : html.Div
+        A search to compare teams side by side, above a paged table of summary
+        statistics for each team across seasons.
+    """
+    if league_dataset is None:
+        raise PreventUpdate
+
+    league_build, season_overview_output = get_league_output_shared(
+        league_id=league_dataset["league_id"],
+        output="season_overview_output",
+        season_start_year=season_start_year[0],
     )
 
-    season_overview_output = season_overview_output.T
     season_overview_output_dash_header = f"Team Summary Statistics"
-    season_overview_output_dash = dash_table.DataTable(
-        id="df",
-        columns=[{"name": i, "id": i} for i in season_overview_output.columns],
-        data=season_overview_output.to_dict(orient="records"),
-        style_cell=style_cell_tables,
-        style_header=style_header_tables,
-        export_format="csv",
+    team_comparison_ids = season_overview_output.index[
+        :team_comparison_default
+    ].tolist()
+    season_overview_output_dash = html.Div(
+        children=[
+            dcc.Dropdown(
+                id="team-compare",
+                options=get_team_options(
+                    df=season_overview_output,
+                    search_value="",
+                    selected=team_comparison_ids,
+                    limit=team_options_limit,
+                ),
+                value=team_comparison_ids,
+                multi=True,
+                placeholder="Search for teams to compare",
+            ),
+            html.Div(
+                id="team-comparison",
+                children=[
+                    team_comparison_dash_format(
+                        df=season_overview_output, team_ids=team_comparison_ids
+                    )
+                ],
+            ),
+            html.Br(),
+            paged_table_dash_format(
+                id_table="season-overview-data", df=season_overview_output
+            ),
+        ]
+    )
+
+    return season_overview_output_dash_header, season_overview_output_dash
+
+
+@app.callback(
+    [
+        Output(component_id="current-season-header", component_property="children"),
+        Output(component_id="current-season", component_property="children"),
+    ],
+    Input(component_id="league-dataset", component_property="data"),
+    prevent_initial_call=True,
+)
+def dash_get_season_current(league_dataset):
+    """
+    Shows the first page of the current season of the league.
+
+    The current season is the same whatever the starting season, so it is only shown
+    again when a league is loaded.
+
+    Parameters:
+    -----------
+    league_dataset : dict
+        The key of the loaded league dataset.
+
+    Returns:
+    --------
+    season_current_df_output_dash_header : str
+        Header for the current season output table.
+    season_current_df_output_dash : dash_table.DataTable
+        DataTable containing information about the current season of the league.
+    """
+    if league_dataset is None:
+        raise PreventUpdate
+
+    league_build, season_current_df_output = get_league_output_shared(
+        league_id=league_dataset["league_id"],
+        output="season_current",
+        season_start_year=None,
     )
 
+    final_gw_finished = league_build[3]
+    current_gamekweek = league_build[7]
+
     if final_gw_finished:
         season_current_df_output_dash_header = f"Current Season (Completed)"
     else:
@@ -449,32 +812,168 @@ def dash_get_team_and_league_data(league_id, season_start_year):
             f"Current Season (GW {current_gamekweek})"
         )
 
-    season_current_df_output_dash = dash_table.DataTable(
-        id="df",
-        columns=[{"name": i, "id": i} for i in season_current_df_output.columns],
-        data=season_current_df_output.to_dict(orient="records"),
-        style_cell=style_cell_tables,
-        style_header=style_header_tables,
-        export_format="csv",
+    season_current_df_output_dash = paged_table_dash_format(
+        id_table="current-season-data", df=season_current_df_output
+    )
+
+    return season_current_df_output_dash_header, season_current_df_output_dash
+
+
+@app.callback(
+    Output(component_id="team-compare", component_property="options"),
+    Input(component_id="team-compare", component_property="search_value"),
+    State(component_id="team-compare", component_property="value"),
+    State(component_id="league-dataset", component_property="data"),
+    State(component_id="year-select", component_property="value"),
+    prevent_initial_call=True,
+)
+def dash_get_team_options(search_value, team_ids, league_dataset, season_start_year):
+    """
+    Offers the teams matching the text entered in the team search.
+
+    Parameters:
+    -----------
+    search_value : str
+        The text entered in the team search.
+    team_ids : list of int
+        The IDs of the teams already selected.
+    league_dataset : dict
+        The key of the loaded league dataset.
+    season_start_year : int
+        The starting year of the season.
+
+    Returns:
+    --------
+    options : list of dict
+        The selected teams, and up to team_options_limit matching teams.
+    """
+    if not search_value or league_dataset is None:
+        raise PreventUpdate
+
+    league_build, season_overview_output = get_league_output_shared(
+        league_id=league_dataset["league_id"],
+        output="season_overview_output",
+        season_start_year=season_start_year[0],
     )
 
-    return (
-        league_name,
-        league_summary_kpis_dash,
-        titles_won_summary_output_dash_header,
-        titles_won_summary_output_dash,
-        seasons_top_three_output_dash_header,
-        seasons_top_three_output_dash,
-        all_time_table_output_dash_header,
-        all_time_table_output_dash,
-        season_history_df_output_dash_header,
-        season_history_df_output_dash,
-        season_overview_output_dash_header,
-        season_overview_output_dash,
-        season_current_df_output_dash_header,
-        season_current_df_output_dash,
+    options = get_team_options(
+        df=season_overview_output,
+        search_value=search_value,
+        selected=team_ids,
+        limit=team_options_limit,
     )
 
+    return options
+
+
+@app.callback(
+    Output(component_id="team-comparison", component_property="children"),
+    Input(component_id="team-compare", component_property="value"),
+    State(component_id="league-dataset", component_property="data"),
+    State(component_id="year-select", component_property="value"),
+    prevent_initial_call=True,
+)
+def dash_get_team_comparison(team_ids, league_dataset, season_start_year):
+    """
+    Sets the summary statistics of the selected teams side by side.
+
+    Parameters:
+    -----------
+    team_ids : list of int
+        The IDs of the selected teams.
+    league_dataset : dict
+        The key of the loaded league dataset.
+    season_start_year : int
+        The starting year of the season.
+
+    Returns:
+    --------
+    team_comparison_dash : dash_table.DataTable
+        DataTable comparing the selected teams.
+    """
+    if league_dataset is None:
+        raise PreventUpdate
+
+    league_build, season_overview_output = get_league_output_shared(
+        league_id=league_dataset["league_id"],
+        output="season_overview_output",
+        season_start_year=season_start_year[0],
+    )
+
+    team_comparison_dash = team_comparison_dash_format(
+        df=season_overview_output, team_ids=team_ids or []
+    )
+
+    return team_comparison_dash
+
+
+def dash_get_table_page(
+    page_current, page_size, sort_by, filter_query, league_dataset, season_start_year
+):
+    """
+    Sends the page of a paged table being viewed, sorted and filtered on the server.
+
+    The table is read from the output tables kept for the loaded league and starting
+    season, so only the rows on the page are sent to the browser.
+
+    Parameters:
+    -----------
+    page_current : int
+        The index of the page being viewed.
+    page_size : int
+        The number of rows on a page.
+    sort_by : list of dict
+        The columns to sort by, and their direction.
+    filter_query : str
+        The filter conditions entered in the table.
+    league_dataset : dict
+        The key of the loaded league dataset.
+    season_start_year : int
+        The starting year of the season.
+
+    Returns:
+    --------
+    data : list of dict
+        The rows on the page.
+    page_count : int
+        The number of pages of filtered rows.
+    """
+    if league_dataset is None:
+        raise PreventUpdate
+
+    id_table = dash.callback_context.outputs_list[0]["id"]
+    league_build, league_output = get_league_output_shared(
+        league_id=league_dataset["league_id"],
+        output=paged_tables[id_table],
+        season_start_year=season_start_year[0],
+    )
+
+    data, page_count = get_table_page(
+        df=league_output,
+        page_current=page_current,
+        page_size=page_size,
+        sort_by=sort_by,
+        filter_query=filter_query,
+    )
+
+    return data, page_count
+
+
+for id_table in paged_tables:
+    app.callback(
+        [
+            Output(component_id=id_table, component_property="data"),
+            Output(component_id=id_table, component_property="page_count"),
+        ],
+        Input(component_id=id_table, component_property="page_current"),
+        Input(component_id=id_table, component_property="page_size"),
+        Input(component_id=id_table, component_property="sort_by"),
+        Input(component_id=id_table, component_property="filter_query"),
+        State(component_id="league-dataset", component_property="data"),
+        State(component_id="year-select", component_property="value"),
+        prevent_initial_call=True,
+    )(dash_get_table_page)
+
 
 if __name__ == "__main__":
     # app.run_server(debug=False)
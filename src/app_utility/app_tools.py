@@ -1,4 +1,5 @@
 import datetime
+import math
 import pandas as pd
 
 
@@ -75,3 +76,273 @@ def generate_commentary(league_name, number_of_teams, year_start):
 
     commetnary_p1 = f"""The {league_name} is the highest level of the Fantasy English football league system. It is contested by {number_of_teams} clubs, and seasons typically run from August to May, with each team playing in 38 gameweeks. The league was founded in {year_start}."""
     return commetnary_p1
+
+
+def get_league_status_message(league_status):
+    """
+    Generate a warning message describing any data missing from a league build.
+
+    Parameters
+    ----------
+    league_status : dict
+        Status of the league build, including whether the league was truncated, whether
+        the build ran out of time, and the teams with missing data.
+
+    Returns
+    -------
+    message : str
+        A warning message, or an empty string if the league data is complete.
+    """
+    messages = []
+    number_of_teams_read = league_status["number_of_teams_read"]
+
+    if league_status["truncated"]:
+        messages.append(
+            f"This league is too large to load in full, only the first {number_of_teams_read:,} teams are included."
+        )
+    if league_status["deadline_exceeded"]:
+        messages.append(
+            f"The league took too long to load, only the first {number_of_teams_read:,} teams are included."
+        )
+    if league_status["missing_entries"]:
+        number_of_teams_missing = len(league_status["missing_entries"])
+        messages.append(
+            f"Data for {number_of_teams_missing:,} teams could not be loaded, so their results are incomplete."
+        )
+
+    message = " ".join(messages)
+    return message
+
+
+# Operators of a DataTable filter query, longest first so e.g. "ge" is not read as "gt"
+filter_operators = {
+    "ge": "ge",
+    ">=": "ge",
+    "le": "le",
+    "<=": "le",
+    "lt": "lt",
+    "<": "lt",
+    "gt": "gt",
+    ">": "gt",
+    "ne": "ne",
+    "!=": "ne",
+    "eq": "eq",
+    "=": "eq",
+    "contains": "contains",
+    "icontains": "contains",
+    "scontains": "contains",
+    "datestartswith": "datestartswith",
+}
+
+
+def split_filter_part(filter_part):
+    """
+    Splits one condition of a DataTable filter query into its column, operator and value.
+
+    Parameters
+    ----------
+    filter_part : str
+        A single condition, e.g. "{Total Points} ge 2000".
+
+    Returns
+    -------
+    column : str or None
+        The column the condition is on, or None if the condition can't be read.
+    operator : str or None
+        The pandas name of the operator, e.g. "ge", or "contains".
+    value : str or None
+        The value to compare with, without any quotes.
+    """
+    filter_part = filter_part.strip()
+    if not filter_part.startswith("{") or "}" not in filter_part:
+        return None, None, None
+
+    column, condition = filter_part[1:].split("}", 1)
+    condition = condition.strip()
+
+    for operator_text in sorted(filter_operators, key=len, reverse=True):
+        if condition.startswith(operator_text):
+            operator = filter_operators[operator_text]
+            value = condition[len(operator_text) :].strip()
+            break
+    else:
+        return None, None, None
+
+    if len(value) > 1 and value[0] == value[-1] and value[0] in ("'", '"', "`"):
+        value = value[1:-1].replace("\\" + value[0], value[0])
+
+    return column, operator, value
+
+
+def filter_table(df, filter_query):
+    """
+    Keeps the rows of a table matching a DataTable filter query.
+
+    Text columns are compared as text and numeric columns as numbers, and "contains"
+    matches case-insensitively on the text of any column.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        The table to filter.
+    filter_query : str
+        The filter query of the DataTable, conditions joined by " && ".
+
+    Returns
+    -------
+    pandas.DataFrame
+        The rows of df matching every condition that can be read.
+    """
+    if not filter_query:
+        return df
+
+    mask = pd.Series(True, index=df.index)
+    for filter_part in filter_query.split(" && "):
+        column, operator, value = split_filter_part(filter_part=filter_part)
+        if column not in df.columns:
+            continue
+
+        values = df[column]
+        if operator in ("contains", "datestartswith"):
+            text = values.astype(str)
+            if operator == "contains":
+                condition = text.str.contains(value, case=False, regex=False)
+            else:
+                condition = text.str.startswith(value)
+        elif pd.api.types.is_numeric_dtype(values):
+            number = pd.to_numeric(value, errors="coerce")
+            if pd.isna(number):
+                continue
+            condition = getattr(values, operator)(number).fillna(False)
+        else:
+            condition = getattr(values.astype(str), operator)(value)
+
+        mask &= condition.astype(bool)
+
+    return df[mask]
+
+
+def sort_table(df, sort_by):
+    """
+    Sorts a table by the columns selected in a DataTable.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        The table to sort.
+    sort_by : list of dict
+        The sort_by property of the DataTable, with the "column_id" and "direction"
+        of each column to sort by.
+
+    Returns
+    -------
+    pandas.DataFrame
+        The sorted table, ties keeping their order in df.
+    """
+    sort_by = [item for item in sort_by or [] if item["column_id"] in df.columns]
+    if not sort_by:
+        return df
+
+    def sort_key(values):
+        # Unordered categories are sorted by their text rather than their codes
+        if isinstance(values.dtype, pd.CategoricalDtype) and not values.cat.ordered:
+            return values.astype(str)
+        return values
+
+    return df.sort_values(
+        by=[item["column_id"] for item in sort_by],
+        ascending=[item["direction"] == "asc" for item in sort_by],
+        kind="mergesort",
+        na_position="last",
+        key=sort_key,
+    )
+
+
+def get_table_page(df, page_current, page_size, sort_by=None, filter_query=None):
+    """
+    Filters and sorts a table and returns one page of its rows.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        The full table.
+    page_current : int
+        The index of the page to return, starting at 0.
+    page_size : int
+        The number of rows on a page.
+    sort_by : list of dict, optional
+        The sort_by property of the DataTable.
+    filter_query : str, optional
+        The filter_query property of the DataTable.
+
+    Returns
+    -------
+    records : list of dict
+        The rows on the page.
+    page_count : int
+        The number of pages of filtered rows, at least 1.
+    """
+    df = filter_table(df=df, filter_query=filter_query)
+    df = sort_table(df=df, sort_by=sort_by)
+
+    page_count = max(math.ceil(len(df) / page_size), 1)
+    page_current = min(page_current or 0, page_count - 1)
+
+    start = page_current * page_size
+    records = df.iloc[start : start + page_size].to_dict(orient="records")
+
+    return records, page_count
+
+
+def get_team_labels(df):
+    """
+    Label each team of the season overview by its team and manager name.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        The output of reformat_season_overview.
+
+    Returns
+    -------
+    pandas.Series
+        The label of each team, indexed by team ID.
+    """
+    return df["Team"].astype(str) + " (" + df["Manager"].astype(str) + ")"
+
+
+def get_team_options(df, search_value, selected, limit):
+    """
+    Generate the options of a team search, with the teams already selected.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        The output of reformat_season_overview.
+    search_value : str
+        The text searched for in the team and manager names.
+    selected : list of int
+        The IDs of the teams already selected.
+    limit : int
+        The largest number of matching teams to return.
+
+    Returns
+    -------
+    options : list of dict
+        The "label" and "value" (team ID) of the selected teams, then of up to limit
+        matching teams in the order of df.
+    """
+    team_labels = get_team_labels(df=df)
+    selected = [team_id for team_id in selected or [] if team_id in team_labels.index]
+
+    matches = team_labels[
+        team_labels.str.contains(search_value or "", case=False, regex=False)
+    ]
+    matches = matches.drop(selected, errors="ignore").iloc[:limit]
+
+    options = [
+        {"label": label, "value": int(team_id)}
+        for team_id, label in pd.concat([team_labels[selected], matches]).items()
+    ]
+
+    return options
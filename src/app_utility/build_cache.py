@@ -0,0 +1,87 @@
+import collections
+import concurrent.futures
+import threading
+
+
+class BuildCache:
+    """
+    Keeps values derived from league builds, dropping the least recently used once
+    there are more than a set number.
+
+    Each value is kept with the league build it was derived from, and is only returned
+    for that same build, so values are computed again once a league is built again.
+    Callers arriving while the same value is being computed wait for it rather than
+    computing it again.
+    """
+
+    def __init__(self, limit):
+        self._limit = limit
+        self._lock = threading.Lock()
+        self._values = collections.OrderedDict()
+        self._in_flight = {}
+
+    def get(self, key, build, compute):
+        """
+        Returns the value for a key and build, computing it if it is not kept.
+
+        Parameters
+        ----------
+        key : hashable
+            The key to look up.
+        build : object
+            The league build (or part of it) the value is derived from.
+        compute : callable
+            Called with no arguments on a miss, returns the value.
+
+        Returns
+        -------
+        value : object
+            The kept or freshly computed value, shared between callers.
+        """
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is not None and entry[0] is build:
+                self._values.move_to_end(key)
+                return entry[1]
+
+            # Only the first caller for a key is tracked, callers for a different build
+            # of the same league compute their own value
+            in_flight = self._in_flight.get(key)
+            is_waiting = in_flight is not None and in_flight[0] is build
+            is_leader = in_flight is None
+            if is_waiting:
+                future = in_flight[1]
+            elif is_leader:
+                future = concurrent.futures.Future()
+                self._in_flight[key] = (build, future)
+
+        if is_waiting:
+            return future.result()
+
+        try:
+            value = compute()
+        except BaseException as error:
+            if is_leader:
+                with self._lock:
+                    del self._in_flight[key]
+                future.set_exception(error)
+            raise
+
+        with self._lock:
+            self._values[key] = (build, value)
+            self._values.move_to_end(key)
+            while len(self._values) > self._limit:
+                self._values.popitem(last=False)
+            if is_leader:
+                del self._in_flight[key]
+        if is_leader:
+            future.set_result(value)
+
+        return value
+
+    def clear(self):
+        """
+        Removes every kept value. Values being computed are unaffected.
+        """
+        with self._lock:
+            self._values.clear()
@@ -1,19 +1,24 @@
+import collections
+import threading
+import time
 import pandas as pd
 
 from src.data_prep.load_data import (
-    get_league_data,
-    get_league_history,
+    get_league_data_streamed,
     get_current_season_information,
-    get_managers_information_league,
 )
 from src.data_prep.reshape_data import (
     summarise_season_current,
     summarise_season_history,
 )
+from src.data_prep.single_flight import SingleFlightCache
+from src.app_utility.build_cache import BuildCache
 from src.data_prep.output_league_season_current import reformat_season_current
 from src.data_prep.output_league_seasons_history import (
     filter_rehsaped_season_history,
     get_season_overview,
+    get_team_season_statistics_by_start,
+    get_team_season_statistics_from_start,
     get_seasons_by_top_three_teams,
     get_titles_won_summary,
     reformat_season_overview,
@@ -21,23 +26,15 @@ from src.data_prep.output_league_seasons_history import (
     get_all_time_table,
 )
 
-from src.data_prep.output_league_summary import (
-    get_current_champions,
-    get_most_wins,
-    get_best_rank_points,
-    get_number_of_teams_league,
-    get_first_Season_year_data,
-    get_league_name,
-    get_league_summary_kpis,
-)
+from src.data_prep.output_league_summary import get_league_summary
 
 
 def get_team_and_league_data(league_id):
-    league_data, team_data = get_league_data(league_id=league_id)
-
-    manager_information = get_managers_information_league(team_data=team_data)
+    league_data, team_data, manager_information, season_history, league_status = (
+        get_league_data_streamed(league_id=league_id)
+    )
 
-    season_history = get_league_history(team_data=team_data)
+    league_status["number_of_teams_read"] = len(team_data)
 
     final_gw_finished, current_season_year, team_ids, current_gamekweek = (
         get_current_season_information()
@@ -63,73 +60,375 @@ def get_team_and_league_data(league_id):
         season_history_df,
         current_gamekweek,
         team_data,
+        league_status,
     )
 
 
-def get_team_and_league_data_filtered_summarised(
-    league_data,
-    manager_information,
-    team_ids,
-    season_current_df,
-    season_history_df,
-    season_start_year,
-    team_data,
-):
-    season_history_df_filtered = filter_rehsaped_season_history(
-        season_start_year=season_start_year, df=season_history_df
-    )
+# Seconds a finished league build is served to later requests for the same league
+league_build_ttl = 10 * 60
 
-    season_overview = get_season_overview(
-        df=season_history_df_filtered,
-        manager_information=manager_information,
-        team_ids=team_ids,
-    )
+# Number of fresh league builds kept in the shared store
+league_build_limit = 64
 
-    current_champions_output = get_current_champions(
-        df=season_history_df_filtered, season_overview=season_overview
-    )
+# Shared store of league builds, keyed by league ID, least recently used first
+_league_builds = SingleFlightCache(limit=league_build_limit)
+
+
+def get_team_and_league_data_shared(league_id):
+    """
+    Returns the league build for a league ID, sharing it between concurrent callers.
+
+    Callers arriving while a build of the same league is in flight wait for that
+    build rather than starting their own, and finished builds are served from a
+    shared store for league_build_ttl seconds, up to league_build_limit of them. Builds
+    that ran out of time or are missing teams are not kept, so the next caller tries
+    again. The returned data is shared, so it must not be modified.
+
+    Parameters
+    ----------
+    league_id : int
+        The ID of the league.
+
+    Returns
+    -------
+    tuple
+        The outputs of get_team_and_league_data.
+    """
+
+    def build():
+        league_build = get_team_and_league_data(league_id=league_id)
+
+        league_status = league_build[9]
+        expires_at = time.time() + league_build_ttl
+        if league_status["deadline_exceeded"] or league_status["missing_entries"]:
+            expires_at = time.time()
+
+        return league_build, expires_at
+
+    return _league_builds.get(key=league_id, load=build)
+
+
+# Number of loaded leagues kept for refiltering without fetching them again
+league_dataset_limit = 64
+
+# League builds loaded by the dashboard, keyed by league ID, least recently used first
+_league_datasets = collections.OrderedDict()
+_league_datasets_lock = threading.Lock()
 
-    most_season_won_teams_str_output = get_most_wins(df=season_overview)
-    best_rank_teams_str = get_best_rank_points(
-        df=season_history_df_filtered, column="rank"
+
+def load_league_dataset(league_id):
+    """
+    Loads the league build for a league ID and keeps it for get_league_dataset.
+
+    The build comes from get_team_and_league_data_shared, so it is only fetched if no
+    fresh build is shared already. The league_dataset_limit most recently used builds
+    are kept, however old they are.
+
+    Parameters
+    ----------
+    league_id : int
+        The ID of the league.
+
+    Returns
+    -------
+    tuple
+        The outputs of get_team_and_league_data.
+    """
+    league_build = get_team_and_league_data_shared(league_id=league_id)
+
+    with _league_datasets_lock:
+        _league_datasets[league_id] = league_build
+        _league_datasets.move_to_end(league_id)
+        while len(_league_datasets) > league_dataset_limit:
+            _league_datasets.popitem(last=False)
+
+    return league_build
+
+
+def get_league_dataset(league_id):
+    """
+    Returns the league build kept by load_league_dataset for a league ID.
+
+    Used when only the start year changes, so the league is not fetched again. It is
+    only loaded if it is no longer kept, e.g. after a restart. The returned data is
+    shared, so it must not be modified.
+
+    Parameters
+    ----------
+    league_id : int
+        The ID of the league.
+
+    Returns
+    -------
+    tuple
+        The outputs of get_team_and_league_data.
+    """
+    with _league_datasets_lock:
+        league_build = _league_datasets.get(league_id)
+        if league_build is not None:
+            _league_datasets.move_to_end(league_id)
+
+    if league_build is None:
+        league_build = load_league_dataset(league_id=league_id)
+
+    return league_build
+
+
+# Number of leagues whose per-team statistics by start year are kept
+team_statistics_limit = 64
+
+# Per-team statistics for every start season of a league's history, keyed by league ID
+_team_statistics = BuildCache(limit=team_statistics_limit)
+
+
+def get_team_statistics_shared(league_id, season_history_df, season_start_year):
+    """
+    Returns the per-team statistics of a league's history from a start year.
+
+    The statistics for every start season are precomputed once per league build, so
+    each start year is a lookup shared by every output derived from it. They are
+    precomputed again when the league is built again. The returned DataFrame must not
+    be modified.
+
+    Parameters
+    ----------
+    league_id : int
+        The ID of the league.
+    season_history_df : pandas.DataFrame
+        The reshaped season history of the league.
+    season_start_year : int
+        The start year of the seasons to include.
+
+    Returns
+    -------
+    team_statistics : pandas.DataFrame
+        The output of get_team_season_statistics_from_start for the start year.
+    """
+    statistics_by_start = _team_statistics.get(
+        key=league_id,
+        build=season_history_df,
+        compute=lambda: get_team_season_statistics_by_start(df=season_history_df),
     )
 
-    best_points_teams_str_output = get_best_rank_points(
-        df=season_history_df_filtered, column="total_points"
+    team_statistics = get_team_season_statistics_from_start(
+        statistics_by_start=statistics_by_start, season_start_year=season_start_year
     )
 
-    number_of_teams_league = get_number_of_teams_league(team_data=team_data)
+    return team_statistics
+
 
-    first_Season_year_data = get_first_Season_year_data(df=season_history_df_filtered)
+# Outputs of a league that are the same whatever the start year
+start_year_independent_outputs = {"season_current"}
 
-    league_name = get_league_name(league_data=league_data)
 
-    league_summary_kpis = get_league_summary_kpis(
-        first_Season_year_data=first_Season_year_data,
-        number_of_teams_league=number_of_teams_league,
-        current_champions_output=current_champions_output,
-        most_season_won_teams_str_output=most_season_won_teams_str_output,
-        best_points_teams_str_output=best_points_teams_str_output,
-        best_rank_teams_str=best_rank_teams_str,
+def build_league_output(league_build, output, season_start_year, get_output):
+    """
+    Computes one output table of a league build from a start year.
+
+    Every app builds its tables through this function, whether it keeps them per
+    output (get_league_output) or all together (get_team_and_league_data_filtered_summarised).
+
+    Parameters
+    ----------
+    league_build : tuple
+        The outputs of get_team_and_league_data.
+    output : str
+        The output to compute, one of "league_summary", "season_overview",
+        "seasons_top_three", "titles_won_summary", "season_overview_output",
+        "season_current", "season_history" or "all_time_table".
+    season_start_year : int
+        The start year of the seasons to include.
+    get_output : callable
+        Called with the name of another output, returns it for the same build and start
+        year. Used for outputs derived from others, e.g. the titles won from the season
+        overview.
+
+    Returns
+    -------
+    object
+        The output, as returned by get_team_and_league_data_filtered_summarised, except
+        "league_summary" which is the (league_name, league_summary_kpis) tuple and
+        "season_overview" which is the output of get_season_overview.
+    """
+    (
+        league_data,
+        manager_information,
+        team_ids,
+        final_gw_finished,
+        season_history,
+        season_current_df,
+        season_history_df,
+        current_gamekweek,
+        team_data,
+        league_status,
+    ) = league_build
+
+    if output == "season_current":
+        return reformat_season_current(df=season_current_df)
+
+    season_history_df_filtered = filter_rehsaped_season_history(
+        season_start_year=season_start_year, df=season_history_df
     )
 
-    seasons_top_three_output = get_seasons_by_top_three_teams(
-        df=season_history_df_filtered
+    if output == "seasons_top_three":
+        return get_seasons_by_top_three_teams(df=season_history_df_filtered)
+    if output == "season_history":
+        return reformat_season_history(df=season_history_df_filtered)
+
+    team_statistics = get_team_statistics_shared(
+        league_id=league_data["league"]["id"],
+        season_history_df=season_history_df,
+        season_start_year=season_start_year,
     )
 
-    titles_won_summary_output = get_titles_won_summary(df=season_overview)
-    season_overview_output = reformat_season_overview(df=season_overview)
-    season_current_df_output = reformat_season_current(df=season_current_df)
-    season_history_df_output = reformat_season_history(df=season_history_df_filtered)
-    all_time_table_output = get_all_time_table(df=season_history_df_filtered)
+    if output == "all_time_table":
+        return get_all_time_table(
+            df=season_history_df_filtered, team_statistics=team_statistics
+        )
+    if output == "season_overview":
+        return get_season_overview(
+            df=season_history_df_filtered,
+            manager_information=manager_information,
+            team_ids=team_ids,
+            team_statistics=team_statistics,
+        )
+
+    season_overview = get_output("season_overview")
+
+    if output == "league_summary":
+        return get_league_summary(
+            df=season_history_df_filtered,
+            season_overview=season_overview,
+            team_data=team_data,
+            league_data=league_data,
+        )
+    if output == "titles_won_summary":
+        return get_titles_won_summary(df=season_overview)
+    if output == "season_overview_output":
+        return reformat_season_overview(df=season_overview)
+
+    raise ValueError(f"Unknown league output: {output}")
+
+
+def get_team_and_league_data_filtered_summarised(league_build, season_start_year):
+    """
+    Computes every output table of a league build from a start year.
+
+    Parameters
+    ----------
+    league_build : tuple
+        The outputs of get_team_and_league_data.
+    season_start_year : int
+        The start year of the seasons to include.
+
+    Returns
+    -------
+    tuple
+        The league name, summary KPIs, top three of each season, titles won, season
+        overview, current season, previous seasons and all-time table.
+    """
+    outputs = {}
+
+    def get_output(output):
+        if output not in outputs:
+            outputs[output] = build_league_output(
+                league_build=league_build,
+                output=output,
+                season_start_year=season_start_year,
+                get_output=get_output,
+            )
+        return outputs[output]
+
+    league_name, league_summary_kpis = get_output("league_summary")
 
     return (
         league_name,
         league_summary_kpis,
-        seasons_top_three_output,
-        titles_won_summary_output,
-        season_overview_output,
-        season_current_df_output,
-        season_history_df_output,
-        all_time_table_output,
+        get_output("seasons_top_three"),
+        get_output("titles_won_summary"),
+        get_output("season_overview_output"),
+        get_output("season_current"),
+        get_output("season_history"),
+        get_output("all_time_table"),
+    )
+
+
+# Number of output tables kept, one per league, start year and output
+league_outputs_limit = 1024
+
+# Output tables of the loaded leagues, keyed by league ID, output and start year
+_league_outputs = BuildCache(limit=league_outputs_limit)
+
+
+def get_league_output(league_build, output, season_start_year):
+    """
+    Returns one output table of a league build from a start year, computing it once.
+
+    Each output is kept per league build and start year, so a section of the dashboard
+    only computes the tables it shows, and outputs that don't depend on the start year
+    are shared by every start year. Outputs derived from others read them through this
+    function too, and sections asking for the same output at once share one computation.
+    The returned data is shared, so it must not be modified.
+
+    Parameters
+    ----------
+    league_build : tuple
+        The outputs of get_team_and_league_data.
+    output : str
+        The output to return, see build_league_output.
+    season_start_year : int
+        The start year of the seasons to include.
+
+    Returns
+    -------
+    object
+        The output of build_league_output.
+    """
+    if output in start_year_independent_outputs:
+        season_start_year = None
+
+    league_output = _league_outputs.get(
+        key=(league_build[0]["league"]["id"], output, season_start_year),
+        build=league_build,
+        compute=lambda: build_league_output(
+            league_build=league_build,
+            output=output,
+            season_start_year=season_start_year,
+            get_output=lambda dependency: get_league_output(
+                league_build=league_build,
+                output=dependency,
+                season_start_year=season_start_year,
+            ),
+        ),
     )
+
+    return league_output
+
+
+def get_league_output_shared(league_id, output, season_start_year):
+    """
+    Returns the league build and one output table of a loaded league from a start year.
+
+    Parameters
+    ----------
+    league_id : int
+        The ID of the league.
+    output : str
+        The output to return, see get_league_output.
+    season_start_year : int
+        The start year of the seasons to include.
+
+    Returns
+    -------
+    league_build : tuple
+        The outputs of get_team_and_league_data.
+    league_output : object
+        The output of get_league_output.
+    """
+    league_build = get_league_dataset(league_id=league_id)
+
+    league_output = get_league_output(
+        league_build=league_build, output=output, season_start_year=season_start_year
+    )
+
+    return league_build, league_output
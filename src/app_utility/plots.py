@@ -1,5 +1,8 @@
+import numpy as np
 import pandas as pd
 
+from src.app_utility.build_cache import BuildCache
+
 
 def get_team_plot_history(df, team, value_to_plot):
     """
@@ -29,36 +32,125 @@ def get_team_plot_history(df, team, value_to_plot):
     return filtered_df
 
 
-def get_league_plot_history(df, teams, value_to_plot):
+def get_season_team_history(df, value_to_plot):
+    """
+    Arrange a chosen value to plot into one column per team, for every team.
+
+    Seasons and teams are given integer codes and the values are placed with a single
+    pivot on those codes. Teams are told apart by team ID, or by team and manager name
+    where there is no team ID, so teams sharing a name each get a column, labelled by
+    team and manager name as in get_team_comparison.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        The DataFrame containing the data to be arranged.
+    value_to_plot : str
+        The name of the column containing the values to be plotted.
+
+    Returns
+    -------
+    df_plot : pandas.DataFrame
+        A DataFrame with a row for each season, sorted, the 'Season' as the first
+        column and each team's data for the chosen value to plot as columns.
+    team_columns : dict
+        The columns of df_plot for each team name.
+    """
+    if "team_id" in df.columns:
+        team_key = ["team_id"]
+    else:
+        team_key = [column for column in ["Team", "Manager"] if column in df.columns]
+
+    season_codes, seasons = pd.factorize(df["Season"], sort=True)
+    team_codes, _ = pd.factorize(pd.MultiIndex.from_frame(df[team_key]))
+
+    df_codes = pd.DataFrame(
+        {
+            "season": season_codes,
+            "team": team_codes,
+            "value": df[value_to_plot].reset_index(drop=True),
+        }
+    )
+    df_plot = df_codes.pivot(index="season", columns="team", values="value")
+
+    # Label each team by name, adding the manager name where names are shared
+    team_rows = np.unique(team_codes, return_index=True)[1]
+    team_names = df["Team"].iloc[team_rows].astype(str).reset_index(drop=True)
+    team_labels = team_names.copy()
+    shared_names = team_names.duplicated(keep=False)
+    if "Manager" in df.columns:
+        manager_names = df["Manager"].iloc[team_rows].astype(str)
+        team_labels[shared_names] = (
+            team_names[shared_names]
+            + " ("
+            + manager_names.reset_index(drop=True)[shared_names]
+            + ")"
+        )
+
+    df_plot = df_plot.reindex(index=range(len(seasons)), columns=range(len(team_rows)))
+    df_plot.columns = team_labels.tolist()
+    df_plot.insert(0, "Season", seasons)
+    df_plot = df_plot.reset_index(drop=True)
+
+    team_columns = {}
+    for team_name, team_label in zip(team_names, team_labels):
+        team_columns.setdefault(team_name, []).append(team_label)
+
+    return df_plot, team_columns
+
+
+# Number of league histories arranged for plotting that are kept, one per league and
+# value plotted
+plot_history_limit = 64
+
+# League histories arranged for plotting, keyed by league ID and value plotted
+_plot_histories = BuildCache(limit=plot_history_limit)
+
+
+def get_league_plot_history(df, teams, value_to_plot, league_id=None):
     """
     Extract data for multiple teams and a chosen value to plot.
 
     This function filters a DataFrame to extract data for multiple teams and a chosen value to plot,
     such as goals scored, points earned, or any other relevant metric, and combines them into a single DataFrame.
 
+    Given a league ID, every team of the league is arranged once per value to plot and
+    kept, so plotting any selection of teams from it only selects columns.
+
     Parameters
     ----------
     df : pandas.DataFrame
         The DataFrame containing the data to be filtered.
     teams : list of str
         A list containing the names of the teams for which data will be extracted.
+        Every team with a given name is included, see get_season_team_history.
     value_to_plot : str
         The name of the column containing the values to be plotted.
+    league_id : int, optional
+        The ID of the league df holds, to keep the arranged data for.
 
     Returns
     -------
     pandas.DataFrame
         A DataFrame containing the filtered data for all the specified teams,
-        with the 'Season' as the index and each team's data for the chosen value to plot as columns.
+        with the 'Season' as the first column and each team's data for the chosen value to plot as columns.
     """
-    for i in range(0, len(teams)):
-        if i == 0:
-            df_plot = get_team_plot_history(
-                df, team=teams[0], value_to_plot=value_to_plot
-            )
-        else:
-            df_stage = get_team_plot_history(
-                df, team=teams[i], value_to_plot=value_to_plot
-            )
-            df_plot = pd.merge(df_plot, df_stage, on="Season", how="outer")
+    teams = list(dict.fromkeys(teams))
+
+    if league_id is None:
+        df_plot, team_columns = get_season_team_history(
+            df=df[df["Team"].isin(teams)], value_to_plot=value_to_plot
+        )
+    else:
+        df_plot, team_columns = _plot_histories.get(
+            key=(league_id, value_to_plot),
+            build=df,
+            compute=lambda: get_season_team_history(df=df, value_to_plot=value_to_plot),
+        )
+
+    # Only the seasons any of the teams played
+    columns = [column for team in teams for column in team_columns.get(team, [team])]
+    df_plot = df_plot.reindex(columns=["Season"] + columns)
+    df_plot = df_plot.dropna(how="all", subset=columns).reset_index(drop=True)
+
     return df_plot
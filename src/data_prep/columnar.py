@@ -0,0 +1,132 @@
+import numpy as np
+
+# Columns decoded from the past seasons of each history/ response, and their types
+history_schema = {
+    "season_name": object,
+    "total_points": np.int64,
+    "rank": np.int64,
+    "team_id": np.int64,
+    "team_name": object,
+    "manager_name": object,
+}
+
+# Rows preallocated by a new buffer, doubled whenever it fills up
+initial_capacity = 4096
+
+
+class ColumnBuffer:
+    """
+    Typed, preallocated column arrays for a fixed schema, filled a block of rows at a time.
+
+    Payloads are decoded straight into the arrays as they arrive, rather than being
+    kept as a dict per row and converted to a DataFrame at the end. Repeated strings
+    (season, team and manager names) are stored once and shared between rows.
+    """
+
+    def __init__(self, schema, capacity=initial_capacity):
+        self._length = 0
+        self._columns = {
+            name: np.empty(capacity, dtype=dtype) for name, dtype in schema.items()
+        }
+        self._strings = {}
+
+    def __len__(self):
+        return self._length
+
+    def reserve(self, length):
+        """
+        Grows the arrays, doubling their capacity, until they fit another length rows.
+
+        Parameters
+        ----------
+        length : int
+            The number of rows about to be appended.
+        """
+        capacity = len(next(iter(self._columns.values())))
+        if self._length + length <= capacity:
+            return
+
+        while self._length + length > capacity:
+            capacity *= 2
+
+        for name, column in self._columns.items():
+            grown = np.empty(capacity, dtype=column.dtype)
+            grown[: self._length] = column[: self._length]
+            self._columns[name] = grown
+
+    def append(self, columns, length):
+        """
+        Appends a block of rows.
+
+        Parameters
+        ----------
+        columns : dict
+            For every column in the schema, a sequence of length values, or a single
+            value shared by every row in the block.
+        length : int
+            The number of rows in the block.
+        """
+        self.reserve(length)
+        start, stop = self._length, self._length + length
+
+        for name, values in columns.items():
+            column = self._columns[name]
+            if column.dtype == object:
+                if isinstance(values, str):
+                    values = self._strings.setdefault(values, values)
+                else:
+                    values = [
+                        self._strings.setdefault(value, value) for value in values
+                    ]
+            column[start:stop] = values
+
+        self._length = stop
+
+    def get_columns(self, mask=None):
+        """
+        Returns the filled part of each column.
+
+        Parameters
+        ----------
+        mask : numpy.ndarray, optional
+            A boolean array selecting the rows to return.
+
+        Returns
+        -------
+        columns : dict
+            The column arrays, keyed by name in schema order. Views of the buffer
+            unless a mask is given.
+        """
+        columns = {
+            name: column[: self._length] for name, column in self._columns.items()
+        }
+        if mask is not None:
+            columns = {name: column[mask] for name, column in columns.items()}
+        return columns
+
+
+def append_team_history(buffer, history, team):
+    """
+    Decodes the past seasons of a team's history response into a history buffer.
+
+    Parameters
+    ----------
+    buffer : ColumnBuffer
+        A buffer with the history_schema columns.
+    history : dict
+        The history response for one team.
+    team : dict
+        The team's standings data.
+    """
+    past = history["past"]
+    buffer.append(
+        columns={
+            "season_name": [item["season_name"] for item in past],
+            "total_points": [item["total_points"] for item in past],
+            "rank": [item["rank"] for item in past],
+            "team_id": team["entry"],
+            "team_name": team["entry_name"],
+            "manager_name": team["player_name"],
+        },
+        length=len(past),
+    )
@@ -0,0 +1,362 @@
+import asyncio
+import atexit
+import collections
+import json
+import threading
+import time
+
+import aiohttp
+
+from src.data_prep.http_session import connect_timeout, read_timeout
+from src.data_prep.rate_limit import (
+    get_backoff,
+    get_hedge_delay,
+    get_limiter,
+    hedge_check_interval,
+    is_retryable_status,
+    max_hedges,
+    max_retries,
+)
+from src.data_prep.response_cache import get_cached_response, set_cached_response
+
+# Bound on requests in flight for a single fetch call
+max_concurrency = 100
+
+# Bound on open connections shared by every fetch call on the event loop
+connection_limit = 100
+
+_loop = None
+_loop_lock = threading.Lock()
+_client_session = None
+
+
+def get_event_loop():
+    """
+    Returns the shared background event loop, starting it on first use.
+
+    All asyncio fetches run on this one loop, so concurrent callers (e.g. several
+    dashboard users) share a single thread and connection pool.
+
+    Returns
+    -------
+    loop : asyncio.AbstractEventLoop
+        The running background event loop.
+    """
+    global _loop
+
+    if _loop is None:
+        with _loop_lock:
+            if _loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever, name="fetch-event-loop", daemon=True
+                )
+                thread.start()
+                _loop = loop
+                atexit.register(close_event_loop)
+
+    return _loop
+
+
+async def get_client_session():
+    """
+    Returns the shared aiohttp session, creating it on first use.
+
+    Only called from the background event loop, so no locking is needed.
+
+    Returns
+    -------
+    session : aiohttp.ClientSession
+        The shared client session.
+    """
+    global _client_session
+
+    if _client_session is None or _client_session.closed:
+        connector = aiohttp.TCPConnector(limit=connection_limit)
+        _client_session = aiohttp.ClientSession(
+            connector=connector,
+            headers={"Accept-Encoding": "gzip, deflate"},
+        )
+
+    return _client_session
+
+
+def close_event_loop():
+    """
+    Closes the shared aiohttp session and stops the background event loop.
+
+    The next asyncio fetch starts a fresh loop and session.
+    """
+    global _loop, _client_session
+
+    with _loop_lock:
+        if _loop is None:
+            return
+
+        if _client_session is not None:
+            asyncio.run_coroutine_threadsafe(_client_session.close(), _loop).result()
+            _client_session = None
+
+        _loop.call_soon_threadsafe(_loop.stop)
+        _loop = None
+
+
+async def fetch_url_async(
+    session, semaphore, url, deadline=None, started=None, hedge=False
+):
+    """
+    Fetches data from a given URL on the event loop.
+    Responses are served from the on-disk response cache while they are fresh.
+
+    Requests go through the host's rate limiter. Throttled (429), server error (5xx),
+    timed out and failed requests, including responses whose body is cut short or
+    does not parse, are retried up to max_retries times with jittered backoff, giving
+    up early if the deadline would pass.
+
+    Parameters
+    ----------
+    session : aiohttp.ClientSession
+        The session to fetch with.
+    semaphore : asyncio.Semaphore
+        Bounds the number of requests in flight.
+    url : str
+        The URL to fetch data from.
+    deadline : float, optional
+        The time.monotonic() time to give up at.
+    started : dict, optional
+        Records the time.monotonic() time the first request for the URL was sent.
+        Cache hits are not recorded, so only network requests time hedges.
+    hedge : bool, optional
+        Whether the request duplicates a straggler, see HostLimiter.try_acquire.
+
+    Returns
+    -------
+    data : dict or None
+        The JSON data retrieved from the URL if the request is successful, otherwise None.
+    """
+    data = get_cached_response(url)
+    if data is not None:
+        return data
+
+    limiter = get_limiter(url)
+
+    for attempt in range(max_retries + 1):
+        async with semaphore:
+            timeout = aiohttp.ClientTimeout(
+                sock_connect=connect_timeout, sock_read=read_timeout
+            )
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                timeout = aiohttp.ClientTimeout(
+                    total=remaining,
+                    sock_connect=connect_timeout,
+                    sock_read=read_timeout,
+                )
+
+            if not await limiter.acquire_async(deadline=deadline, hedge=hedge):
+                return None
+            if started is not None:
+                started.setdefault(url, time.monotonic())
+            # The slot is released however the request ends, including when it is
+            # cancelled (e.g. a hedged copy that lost, or the deadline passing)
+            status = None
+            try:
+                async with session.get(url, timeout=timeout) as response:
+                    content = await response.read()
+                status = response.status
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                pass
+            finally:
+                limiter.release(status=status)
+
+            retry_after = None
+            if status is None:
+                pass
+            elif response.ok:
+                # Only bodies that parse are cached, so a bad response is never
+                # served again
+                try:
+                    data = json.loads(content)
+                except ValueError:
+                    pass
+                else:
+                    set_cached_response(url, content)
+                    return data
+            elif not is_retryable_status(status):
+                return None
+            else:
+                retry_after = response.headers.get("Retry-After")
+
+        if attempt < max_retries:
+            backoff = get_backoff(attempt=attempt, retry_after=retry_after)
+            if deadline is not None and time.monotonic() + backoff > deadline:
+                return None
+            await asyncio.sleep(backoff)
+
+    return None
+
+
+async def fetch_urls_async(
+    urls, concurrency, deadline=None, hedge=False, on_result=None
+):
+    """
+    Fetches multiple URLs on the event loop with bounded concurrency.
+
+    URLs still in flight when the deadline passes are abandoned and left out of the
+    results. With hedging, any request running longer than the 95th percentile of
+    completed requests gets a duplicate request, up to max_hedges duplicates each,
+    and whichever copy finishes first is used.
+
+    Parameters
+    ----------
+    urls : list
+        A list of URLs to fetch.
+    concurrency : int
+        The maximum number of requests in flight.
+    deadline : float, optional
+        The time.monotonic() time to stop waiting at.
+    hedge : bool, optional
+        Whether to send duplicate requests for stragglers.
+    on_result : callable, optional
+        Called on the event loop with (url, data) as each URL finishes, instead of
+        collecting the results. Returns a list of further URLs to fetch on the same queue,
+        ahead of the URLs already waiting.
+
+    Returns
+    -------
+    results : list
+        A list of (url, data) tuples for the URLs that finished, in completion order,
+        or an empty list when on_result is given.
+    """
+    session = await get_client_session()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    started = {}
+    latencies = []
+    hedged = {}
+    queued = set()
+    finished = set()
+    results = []
+    pending = {}
+    waiting = collections.deque()
+
+    def queue(urls, first=False):
+        urls = [url for url in dict.fromkeys(urls) if url not in queued]
+        queued.update(urls)
+        if first:
+            waiting.extendleft(reversed(urls))
+        else:
+            waiting.extend(urls)
+
+    queue(urls)
+
+    # Stop once every URL has a result, leaving the slower copies of hedged requests
+    try:
+        while (pending or waiting) and len(finished) < len(queued):
+            # Only start as many URLs as can be in flight, so URLs queued first by
+            # on_result are not stuck behind the ones already waiting
+            while waiting and len(pending) < concurrency:
+                url = waiting.popleft()
+                task = asyncio.ensure_future(
+                    fetch_url_async(
+                        session, semaphore, url, deadline=deadline, started=started
+                    )
+                )
+                pending[task] = url
+
+            timeout = hedge_check_interval if hedge else None
+            if deadline is not None:
+                remaining = max(0, deadline - time.monotonic())
+                timeout = remaining if timeout is None else min(timeout, remaining)
+
+            done, _ = await asyncio.wait(
+                pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+
+            for task in done:
+                url = pending.pop(task)
+                if url in finished:
+                    continue
+
+                data = task.result()
+                if url not in hedged:
+                    if url in started:
+                        latencies.append(time.monotonic() - started[url])
+                elif data is None and url in pending.values():
+                    # Wait for the other copy of a hedged request
+                    continue
+
+                finished.add(url)
+                if on_result is None:
+                    results.append((url, data))
+                else:
+                    queue(on_result(url, data), first=True)
+
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+
+            # Hedge stragglers once the tail is known
+            hedge_delay = get_hedge_delay(latencies=latencies)
+            if hedge and hedge_delay is not None:
+                now = time.monotonic()
+                for url in set(pending.values()):
+                    copies = hedged.get(url, 0)
+                    if copies >= max_hedges or url not in started:
+                        continue
+                    if now - started[url] > hedge_delay * (copies + 1):
+                        hedged[url] = copies + 1
+                        task = asyncio.ensure_future(
+                            fetch_url_async(
+                                session, semaphore, url, deadline=deadline, hedge=True
+                            )
+                        )
+                        pending[task] = url
+    finally:
+        # Abandon anything unfinished rather than waiting on it
+        for task in pending:
+            task.cancel()
+
+    return results
+
+
+def run_fetch_urls(urls, concurrency=None, deadline=None, hedge=False, on_result=None):
+    """
+    Fetches multiple URLs on the shared event loop from synchronous code.
+
+    Parameters
+    ----------
+    urls : list
+        A list of URLs to fetch.
+    concurrency : int, optional
+        The maximum number of requests in flight, defaults to max_concurrency.
+    deadline : float, optional
+        The time.monotonic() time to stop waiting at, unfinished URLs are left out.
+    hedge : bool, optional
+        Whether to send duplicate requests for stragglers.
+    on_result : callable, optional
+        Called on the event loop with (url, data) as each URL finishes, instead of
+        collecting the results. Returns a list of further URLs to fetch on the same queue,
+        ahead of the URLs already waiting.
+
+    Returns
+    -------
+    results : list
+        A list of (url, data) tuples for the URLs that finished, in completion order,
+        or an empty list when on_result is given.
+    """
+    if concurrency is None:
+        concurrency = max_concurrency
+
+    future = asyncio.run_coroutine_threadsafe(
+        fetch_urls_async(
+            urls=urls,
+            concurrency=concurrency,
+            deadline=deadline,
+            hedge=hedge,
+            on_result=on_result,
+        ),
+        get_event_loop(),
+    )
+    return future.result()
@@ -0,0 +1,80 @@
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Connection pool sizing
+pool_connections = 4
+pool_maxsize = 32
+
+# Seconds to wait to connect, and between bytes of a response, before giving up on a request
+connect_timeout = 3.05
+read_timeout = 10
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def create_session():
+    """
+    Creates a requests Session with a sized, keep-alive connection pool.
+
+    The pool blocks when all connections are in use, so concurrent fetches reuse
+    open connections rather than opening (and discarding) extra ones.
+
+    Returns
+    -------
+    session : requests.Session
+        A session mounted with a pooled HTTPAdapter and gzip negotiation enabled.
+    """
+    session = requests.Session()
+
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=True,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    session.headers.update(
+        {
+            "Accept-Encoding": "gzip, deflate",
+            "Connection": "keep-alive",
+        }
+    )
+
+    return session
+
+
+def get_session():
+    """
+    Returns the shared session used by all API fetches, creating it on first use.
+
+    Returns
+    -------
+    session : requests.Session
+        The process-wide pooled session.
+    """
+    global _session
+
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = create_session()
+
+    return _session
+
+
+def close_session():
+    """
+    Closes the shared session and its pooled connections.
+
+    The next call to get_session creates a fresh session.
+    """
+    global _session
+
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
@@ -1,90 +1,343 @@
-import requests
+import collections
 import concurrent.futures
+import datetime
+import time
+import numpy as np
 import pandas as pd
+import requests
 
-# Set page limit
-page_limit = 10
-
-
-def fetch_url(url):
+from src.data_prep.columnar import ColumnBuffer, append_team_history, history_schema
+from src.data_prep.fetch_async import run_fetch_urls
+from src.data_prep.http_session import (
+    connect_timeout,
+    get_session,
+    pool_maxsize,
+    read_timeout,
+)
+from src.data_prep.rate_limit import (
+    get_backoff,
+    get_hedge_delay,
+    get_limiter,
+    hedge_check_interval,
+    is_retryable_status,
+    max_hedges,
+    max_retries,
+)
+from src.data_prep.response_cache import (
+    get_cached_response,
+    set_cached_response,
+    set_current_season,
+)
+from src.data_prep.single_flight import SingleFlightCache
+
+# Set API location
+api_url = "https://fantasy.premierleague.com/api"
+
+# Set page limit (50 entries per page), None for no limit. Each page costs about 101
+# requests (the page, then each team's entry and history), so 120 pages (6,000 teams)
+# take about 50 seconds at the host rate limit of 250 requests per second, leaving
+# room for retries within build_timeout. Larger leagues are truncated rather than
+# running out of time on every build.
+page_limit = 120
+
+# Number of standings pages fetched ahead of the last page read
+page_window = 5
+
+# Match worker count to the connection pool so every worker holds a live connection
+max_workers = pool_maxsize
+
+# Seconds to reuse the bootstrap-static snapshot, cut short at the next gameweek deadline
+bootstrap_ttl = 5 * 60
+
+# Process-wide bootstrap-static snapshot, keyed by API location
+_bootstrap_cache = SingleFlightCache()
+
+# Seconds a whole league build may take before returning what has completed
+build_timeout = 120
+
+# Return partial results when the build deadline passes, rather than raising TimeoutError
+allow_partial_results = True
+
+# Set how the concurrent helpers fetch: "thread" (ThreadPoolExecutor) or "asyncio" (shared event loop)
+fetch_mode = "thread"
+
+
+def fetch_url(url, deadline=None, hedge=False, started=None):
     """
-    Fetches data from a given URL using the requests library.
+    Fetches data from a given URL using the shared pooled session.
+    Responses are served from the on-disk response cache while they are fresh.
+
+    Requests go through the host's rate limiter. Throttled (429), server error (5xx),
+    timed out and failed requests, including responses whose body is cut short or
+    does not parse, are retried up to max_retries times with jittered backoff, giving
+    up early if the deadline would pass.
 
     Parameters:
     ----------
     url : str
         The URL to fetch data from.
+    deadline : float, optional
+        The time.monotonic() time to give up at.
+    hedge : bool, optional
+        Whether the request duplicates a straggler, see HostLimiter.try_acquire.
+    started : dict, optional
+        Records the time.monotonic() time the first request for the URL was sent.
+        Cache hits are not recorded, so only network requests time hedges.
 
     Returns:
     ----------
     data : dict or None
         The JSON data retrieved from the URL if the request is successful, otherwise None.
     """
-    response = requests.get(url)
-    if response.ok:
-        data = response.json()
+    data = get_cached_response(url)
+    if data is not None:
         return data
-    else:
-        return None
 
+    limiter = get_limiter(url)
+
+    for attempt in range(max_retries + 1):
+        timeout = (connect_timeout, read_timeout)
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            timeout = (min(connect_timeout, remaining), min(read_timeout, remaining))
+
+        if not limiter.acquire(deadline=deadline, hedge=hedge):
+            return None
+        if started is not None:
+            started.setdefault(url, time.monotonic())
+        # The slot is released however the request ends, including on errors that
+        # aren't retried (e.g. a broken chunked response)
+        status = None
+        try:
+            response = get_session().get(url, timeout=timeout)
+            status = response.status_code
+        except requests.RequestException:
+            pass
+        finally:
+            limiter.release(status=status)
+
+        retry_after = None
+        if status is None:
+            pass
+        elif response.ok:
+            # Only bodies that parse are cached, so a bad response is never served again
+            try:
+                data = response.json()
+            except ValueError:
+                pass
+            else:
+                set_cached_response(url, response.content)
+                return data
+        elif not is_retryable_status(status):
+            return None
+        else:
+            retry_after = response.headers.get("Retry-After")
+
+        if attempt < max_retries:
+            backoff = get_backoff(attempt=attempt, retry_after=retry_after)
+            if deadline is not None and time.monotonic() + backoff > deadline:
+                return None
+            time.sleep(backoff)
+
+    return None
 
-# Function to fetch URLs concurrently
-def fetch_urls_concurrently(urls):
+
+def fetch_urls_threaded(urls, deadline=None, hedge=False, on_result=None):
     """
     Fetches multiple URLs concurrently using ThreadPoolExecutor.
 
+    URLs still in flight when the deadline passes are abandoned and left out of the
+    results. With hedging, any request running longer than the 95th percentile of
+    completed requests gets a duplicate request, up to max_hedges duplicates each,
+    and whichever copy finishes first is used.
+
     Parameters:
     ----------
     urls : list
         A list of URLs to fetch.
+    deadline : float, optional
+        The time.monotonic() time to stop waiting at.
+    hedge : bool, optional
+        Whether to send duplicate requests for stragglers.
+    on_result : callable, optional
+        Called with (url, data) as each URL finishes, instead of collecting the
+        results. Returns a list of further URLs to fetch on the same queue, ahead
+        of the URLs already waiting.
 
     Returns:
     ----------
-    results : list:
-        A list containing the fetched results from the URLs.
+    results : list
+        A list of (url, data) tuples for the URLs that finished, in completion order,
+        or an empty list when on_result is given.
     """
-    with concurrent.futures.ThreadPoolExecutor() as executor:
-        # Submit tasks to the executor
-        futures = [executor.submit(fetch_url, url) for url in urls]
-
-        # Retrieve results as they become available
-        results = []
-        for future in concurrent.futures.as_completed(futures):
-            result = future.result()
-            if result:
-                results.append(result)
+    started = {}
+    latencies = []
+    hedged = {}
+    queued = set()
+    finished = set()
+    results = []
+
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+    pending = {}
+    waiting = collections.deque()
+
+    def queue(urls, first=False):
+        urls = [url for url in dict.fromkeys(urls) if url not in queued]
+        queued.update(urls)
+        if first:
+            waiting.extendleft(reversed(urls))
+        else:
+            waiting.extend(urls)
+
+    queue(urls)
+
+    # Stop once every URL has a result, leaving the slower copies of hedged requests
+    try:
+        while (pending or waiting) and len(finished) < len(queued):
+            # Only hand the executor as many URLs as it has workers, so URLs queued
+            # first by on_result are not stuck behind the ones already waiting
+            while waiting and len(pending) < max_workers:
+                url = waiting.popleft()
+                pending[executor.submit(fetch_url, url, deadline, False, started)] = url
+
+            timeout = hedge_check_interval if hedge else None
+            if deadline is not None:
+                remaining = max(0, deadline - time.monotonic())
+                timeout = remaining if timeout is None else min(timeout, remaining)
+
+            done, _ = concurrent.futures.wait(
+                pending,
+                timeout=timeout,
+                return_when=concurrent.futures.FIRST_COMPLETED,
+            )
+
+            for future in done:
+                url = pending.pop(future)
+                if url in finished:
+                    continue
+
+                data = future.result()
+                if url not in hedged and url in started:
+                    latencies.append(time.monotonic() - started[url])
+                elif data is None and url in pending.values():
+                    # Wait for the other copy of a hedged request
+                    continue
+
+                finished.add(url)
+                if on_result is None:
+                    results.append((url, data))
+                else:
+                    queue(on_result(url, data), first=True)
+
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+
+            # Hedge stragglers once the tail is known
+            hedge_delay = get_hedge_delay(latencies=latencies)
+            if hedge and hedge_delay is not None:
+                now = time.monotonic()
+                for url in set(pending.values()):
+                    copies = hedged.get(url, 0)
+                    if copies >= max_hedges or url not in started:
+                        continue
+                    if now - started[url] > hedge_delay * (copies + 1):
+                        hedged[url] = copies + 1
+                        pending[executor.submit(fetch_url, url, deadline, True)] = url
+    finally:
+        # Abandon anything unfinished rather than waiting on it
+        executor.shutdown(wait=False, cancel_futures=True)
+
     return results
 
 
-def fetch_urls_concurrently_with_url(urls):
+def fetch_urls(urls, mode=None, deadline=None, hedge=False, on_result=None):
     """
-    Fetches multiple URLs concurrently using ThreadPoolExecutor.
-    Returns the fetched data along with their corresponding URLs.
+    Fetches multiple URLs with the selected fetch engine.
 
     Parameters:
     ----------
     urls : list
         A list of URLs to fetch.
+    mode : str, optional
+        "thread" or "asyncio", defaults to fetch_mode.
+    deadline : float, optional
+        The time.monotonic() time to stop waiting at, unfinished URLs are left out.
+    hedge : bool, optional
+        Whether to send duplicate requests for stragglers.
+    on_result : callable, optional
+        Called with (url, data) as each URL finishes, instead of collecting the
+        results. Returns a list of further URLs to fetch on the same queue, ahead
+        of the URLs already waiting.
 
     Returns:
     ----------
     results : list
-        A list containing dictionaries with URL and fetched data.
+        A list of (url, data) tuples for the URLs that finished, or an empty list
+        when on_result is given.
     """
-    with concurrent.futures.ThreadPoolExecutor() as executor:
-        # Submit tasks to the executor
-        futures = {executor.submit(fetch_url, url): url for url in urls}
-
-        # Retrieve results as they become available
-        results = []
-        for future in concurrent.futures.as_completed(futures):
-            url = futures[future]
-            result = future.result()
-            if result:
-                # Append the result with its corresponding URL
-                result_with_url = {"url": url, "data": result}
-                results.append(result_with_url)
-    return results
+    mode = mode or fetch_mode
+
+    if mode == "thread":
+        return fetch_urls_threaded(
+            urls=urls, deadline=deadline, hedge=hedge, on_result=on_result
+        )
+    elif mode == "asyncio":
+        return run_fetch_urls(
+            urls=urls, deadline=deadline, hedge=hedge, on_result=on_result
+        )
+    else:
+        raise ValueError(f"Unknown fetch mode: {mode}")
+
+
+def load_bootstrap_data():
+    """
+    Fetches bootstrap-static and keeps the events and teams needed by the app.
+
+    The snapshot expires after bootstrap_ttl seconds, or at the next gameweek deadline
+    if that is sooner, as the current gameweek changes then. bootstrap-static is not
+    kept in the on-disk response cache, so a reload after a deadline is always fresh.
+
+    Returns
+    -------
+    bootstrap_data : dict
+        The events and teams from bootstrap-static.
+    expires_at : float
+        The Unix time the snapshot expires.
+    """
+    url = f"{api_url}/bootstrap-static/"
+    response_data = fetch_url(url)
+
+    bootstrap_data = {
+        "events": response_data["events"],
+        "teams": response_data["teams"],
+    }
+
+    now = time.time()
+    expires_at = now + bootstrap_ttl
+    for event in bootstrap_data["events"]:
+        deadline = datetime.datetime.fromisoformat(event["deadline_time"]).timestamp()
+        if deadline > now:
+            expires_at = min(expires_at, deadline)
+            break
+
+    return bootstrap_data, expires_at
+
+
+def get_bootstrap_data():
+    """
+    Returns the process-wide bootstrap-static snapshot.
+
+    Concurrent callers share a single in-flight fetch, and the parsed snapshot is
+    reused until it expires, so simultaneous builds cost one download.
+
+    Returns
+    -------
+    bootstrap_data : dict
+        The events and teams from bootstrap-static.
+    """
+    return _bootstrap_cache.get(key=api_url, load=load_bootstrap_data)
 
 
 def get_current_season_information():
@@ -104,9 +357,7 @@ def get_current_season_information():
 
     """
 
-    url = "https://fantasy.premierleague.com/api/bootstrap-static/"
-    bootstrap_data = requests.get(url)
-    bootstrap_data = bootstrap_data.json()
+    bootstrap_data = get_bootstrap_data()
 
     final_gw_finished = bootstrap_data["events"][-1]["finished"]
 
@@ -119,111 +370,208 @@ def get_current_season_information():
 
     year_start = bootstrap_data["events"][0]["deadline_time"][0:4]
     current_season_year = f"{year_start}/{str(int(year_start) + 1)[2:4]}"
+    set_current_season(season_name=current_season_year)
 
     team_ids = pd.DataFrame(bootstrap_data["teams"])[["id", "name"]]
 
     return final_gw_finished, current_season_year, team_ids, current_gamekweek
 
 
-def get_league_data_season_started(league_id):
+def get_page_teams(league_data, section):
     """
-    Retrieves league standings data for a given league ID when the season has started.
+    Extracts the team entries from one page of league standings data.
+
+    New entries carry the manager name in two parts, so these are joined into
+    player_name to match the standings schema.
 
     Parameters:
     ----------
-    league_id : int
-        The ID of the league for which standings data is to be fetched.
+    league_data : dict
+        The standings response for one page.
+    section : str
+        The paged section of the standings response, "standings" or "new_entries".
 
     Returns:
     ----------
-    league_data : dict
-        League data retrieved from the first URL.
     team_data : list
-        Team data extracted from all fetched URLs.
+        The team entries on the page.
     """
-    urls = []
-    page = 1
-    url = f"https://fantasy.premierleague.com/api/leagues-classic/{league_id}/standings/?page_standings={page}"
-    urls.append(url)
-
-    league_data = requests.get(url).json()
-    all_results = [league_data]
-
-    while league_data["standings"]["has_next"] == True:
-        page += 1
-
-        if page > page_limit:
-            break
-
-        url = f"https://fantasy.premierleague.com/api/leagues-classic/{league_id}/standings/?page_standings={page}"
-        league_data = requests.get(url).json()
-        urls.append(url)
-        all_results.append(league_data)
-
     team_data = []
-    for item in all_results:
-        if "standings" in item and "results" in item["standings"]:
-            team_data.extend(item["standings"]["results"])
+    if section in league_data and "results" in league_data[section]:
+        team_data = league_data[section]["results"]
 
-    return all_results[0], team_data
+    if section == "new_entries":
+        for team in team_data:
+            team["player_name"] = (
+                f"{team.pop('player_first_name')} {team.pop('player_last_name')}"
+            )
 
+    return team_data
 
-def get_league_data_season_not_started(league_id):
+
+def crawl_league(league_id, section, max_pages=None, deadline=None):
     """
-    Retrieves league new entries data for a given league ID when the season has not started.
+    Crawls a league's standings pages, manager information and history on one work queue.
+
+    Each URL is queued as soon as its inputs are known: when a standings page arrives,
+    the following page_window pages and the manager information and history of every
+    team on the page are queued together, so later pages are read while earlier
+    teams are still being fetched.
 
     Parameters:
     ----------
     league_id : int
-        The ID of the league for which new entries data is to be fetched.
+        The ID of the league.
+    section : str
+        "standings" once the season has started, otherwise "new_entries".
+    max_pages : int, optional
+        The maximum number of standings pages to read, defaults to page_limit.
+    deadline : float, optional
+        The time.monotonic() time to stop crawling at.
 
     Returns:
     ----------
     league_data : dict
-        League data retrieved from the first URL.
+        The first standings page, or None if it could not be fetched.
     team_data : list
-        Team data extracted from all fetched URLs.
+        Team data from every standings page read, in page order.
+    manager_information : list
+        Filtered information about each manager in team_data.
+    league_history : dict
+        Historical data for all teams in team_data, as history_schema column arrays.
+    has_next : bool
+        Whether the last page read has a next page.
+    missing_entries : list
+        The entry IDs of teams whose manager information or history could not be fetched.
     """
-    urls = []
-    page = 1
-    url = f"https://fantasy.premierleague.com/api/leagues-classic/{league_id}/standings/?page_new_entries={page}"
-    urls.append(url)
-
-    league_data = requests.get(url).json()
-    all_results = [league_data]
-
-    while league_data["new_entries"]["has_next"] == True:
-        page += 1
+    max_pages = max_pages or page_limit or float("inf")
+    page_key = f"page_{section}"
+
+    pages = {}
+    page_teams = {}
+    page_numbers = {}
+    last_page = max_pages
+    teams_by_entry = {}
+    entries_by_url = {}
+    manager_information = []
+    league_history = ColumnBuffer(schema=history_schema)
+    fetched_urls = set()
+
+    def get_page_urls(first, last):
+        urls = []
+        for page in range(first, int(min(last, last_page)) + 1):
+            url = f"{api_url}/leagues-classic/{league_id}/standings/?{page_key}={page}"
+            page_numbers[url] = page
+            urls.append(url)
+        return urls
+
+    def on_result(url, data):
+        nonlocal last_page
+
+        if url in page_numbers:
+            page = page_numbers[url]
+            pages[page] = data
+
+            # Stop queueing pages past a failed page or the last page
+            if data is None:
+                last_page = min(last_page, page - 1)
+                return []
+            if data[section]["has_next"] != True:
+                last_page = min(last_page, page)
+
+            team_data = get_page_teams(league_data=data, section=section)
+            page_teams[page] = team_data
+            for team in team_data:
+                teams_by_entry.setdefault(team["entry"], team)
+            manager_urls = get_manager_urls(team_data=team_data)
+            team_urls = get_team_urls(team_data=team_data)
+            for team, manager_url, team_url in zip(team_data, manager_urls, team_urls):
+                entries_by_url[manager_url] = team["entry"]
+                entries_by_url[team_url] = team["entry"]
+
+            return (
+                get_page_urls(first=page + 1, last=page + page_window)
+                + manager_urls
+                + team_urls
+            )
+
+        if data is None:
+            return []
+
+        fetched_urls.add(url)
+        entry = entries_by_url[url]
+        if url.endswith("/history/"):
+            append_team_history(
+                buffer=league_history, history=data, team=teams_by_entry[entry]
+            )
+        else:
+            manager_information.append(get_manager_information(dictionary=data))
 
-        if page > page_limit:
-            break
+        return []
 
-        url = f"https://fantasy.premierleague.com/api/leagues-classic/{league_id}/standings/?page_new_entries={page}"
-        league_data = requests.get(url).json()
-        urls.append(url)
-        all_results.append(league_data)
+    fetch_urls(
+        urls=get_page_urls(first=1, last=1),
+        deadline=deadline,
+        hedge=True,
+        on_result=on_result,
+    )
 
+    # Keep the pages read in order, up to the first one that is missing
+    league_data = pages.get(1)
     team_data = []
-    for item in all_results:
-        if "new_entries" in item and "results" in item["new_entries"]:
-            team_data.extend(item["new_entries"]["results"])
-
-    for team in team_data:
-        team["player_name"] = (
-            f"{team.pop('player_first_name')} {team.pop('player_last_name')}"
-        )
+    has_next = False
+    page = 1
+    while pages.get(page) is not None:
+        team_data.extend(page_teams[page])
+        has_next = pages[page][section]["has_next"] == True
+        if not has_next:
+            break
+        page += 1
 
-    return all_results[0], team_data
+    # Drop teams from speculative pages past the end of the pages kept
+    entries = {team["entry"] for team in team_data}
+    manager_information = [
+        dictionary
+        for dictionary in manager_information
+        if dictionary["entry"] in entries
+    ]
+    team_ids = league_history.get_columns()["team_id"]
+    league_history = league_history.get_columns(mask=np.isin(team_ids, list(entries)))
+
+    missing_entries = [
+        entry
+        for url, entry in entries_by_url.items()
+        if entry in entries and url not in fetched_urls
+    ]
+
+    return (
+        league_data,
+        team_data,
+        manager_information,
+        league_history,
+        has_next,
+        missing_entries,
+    )
 
 
-def get_league_data(league_id):
+def get_league_data_streamed(league_id, max_pages=None, timeout=None):
     """
-    Retrieves league data and team data for a given league ID.
+    Retrieves league data, manager information and history for a given league ID,
+    crawling the standings pages and each team's data on one work queue.
+
+    The whole build shares one deadline. When it passes, what has completed is
+    returned and the league status flags what is missing, unless allow_partial_results
+    is False, in which case TimeoutError is raised. ValueError is raised if the first
+    standings page could not be fetched, e.g. for a league ID that does not exist.
 
     Parameters:
     ----------
     league_id : int
         The ID of the league for which data is to be fetched.
+    max_pages : int, optional
+        The maximum number of standings pages to read, defaults to page_limit.
+    timeout : float, optional
+        The seconds the build may take, defaults to build_timeout.
 
     Returns:
     ----------
@@ -231,79 +579,53 @@ def get_league_data(league_id):
         League data retrieved from the first URL.
     team_data : list
         Team data extracted from all fetched URLs.
+    manager_information : list
+        Filtered information about each manager in the league.
+    league_history : dict
+        Historical data for all teams in the league, as history_schema column arrays.
+    league_status : dict
+        Whether the league was truncated by the page limit, whether the deadline
+        passed, and the entry IDs of teams with missing data.
     """
+    deadline = time.monotonic() + (timeout or build_timeout)
+
     final_gw_finished, current_season_year, team_ids, current_gamekweek = (
         get_current_season_information()
     )
 
     if current_gamekweek != "Season Not Started":
-        return get_league_data_season_started(league_id)
+        section = "standings"
     else:
-        return get_league_data_season_not_started(league_id)
-
-
-def get_league_urls(league_id):
-    """
-    Retrieves URLs for fetching league standings data for a given league ID from the Fantasy Premier League API.
-
-    Parameters:
-    ----------
-    league_id :int
-        The ID of the league for which standings URLs are to be fetched.
-
-    Returns:
-    ----------
-    urls : list
-        A list of URLs for fetching league standings data.
-    """
-    # Loop through each page
-    urls = []
-    page = 1
-    url = f"https://fantasy.premierleague.com/api/leagues-classic/{league_id}/standings/?page_standings={page}"
-    urls.append(url)
-
-    league_data = requests.get(url)
-    league_data = league_data.json()
-
-    while league_data["standings"]["has_next"] == True:
-        page += 1
-
-        url = f"https://fantasy.premierleague.com/api/leagues-classic/{league_id}/standings/?page_standings={page}"
-
-        league_data = requests.get(url)
-        league_data = league_data.json()
-
-        urls.append(url)
-
-    return urls
-
-
-def get_league_data_from_urls(league_id):
-    """
-    Retrieves league data and team data for a given league ID.
+        section = "new_entries"
+
+    (
+        league_data,
+        team_data,
+        manager_information,
+        league_history,
+        has_next,
+        missing_entries,
+    ) = crawl_league(
+        league_id=league_id, section=section, max_pages=max_pages, deadline=deadline
+    )
 
-    Parameters:
-    ----------
-    league_id : int
-        The ID of the league for which data is to be fetched.
+    deadline_exceeded = time.monotonic() >= deadline
+    if deadline_exceeded and not allow_partial_results:
+        raise TimeoutError(
+            f"League {league_id} could not be loaded within {timeout or build_timeout} seconds"
+        )
 
-    Returns:
-    ----------
-    league_data : dict
-        League data retrieved from the first URL.
-    team_data : list
-        Team data extracted from all fetched URLs.
-    """
-    urls = get_league_urls(league_id=league_id)
-    all_results = fetch_urls_concurrently(urls=urls)
+    # Nothing can be built without the league's name and first page of teams
+    if league_data is None:
+        raise ValueError(f"The standings of league {league_id} could not be loaded")
 
-    team_data = []
-    for item in all_results:
-        if "standings" in item and "results" in item["standings"]:
-            team_data.extend(item["standings"]["results"])
+    league_status = {
+        "truncated": has_next and not deadline_exceeded,
+        "deadline_exceeded": deadline_exceeded,
+        "missing_entries": sorted(set(missing_entries)),
+    }
 
-    league_data = all_results[0]
-    return league_data, team_data
+    return league_data, team_data, manager_information, league_history, league_status
 
 
 def get_manager_urls(team_data):
@@ -323,52 +645,32 @@ def get_manager_urls(team_data):
     urls = []
     for team in team_data:
         entry = team["entry"]
-        url = f"https://fantasy.premierleague.com/api/entry/{entry}/"
+        url = f"{api_url}/entry/{entry}/"
         urls.append(url)
     return urls
 
 
-def get_managers_information_league(team_data):
+def get_manager_information(dictionary):
     """
-    Retrieves detailed information about managers in a league based on team data.
-
-    This function takes a list of dictionaries containing team data as input and fetches detailed information
-    about each manager associated with the teams. The function first generates URLs for fetching manager data
-    using the provided team data. Then, it concurrently fetches data from these URLs using the
-    fetch_urls_concurrently function. Finally, it filters and structures the retrieved data to extract
-    relevant manager information such as entry ID, overall rank, player's region ISO code, and favourite team.
+    Filters a manager's entry response down to the information used by the app.
 
     Parameters
     ----------
-    team_data : list
-        A list of dictionaries containing team data, including information about each team in the league.
+    dictionary : dict
+        The entry response for one manager.
 
     Returns
     -------
-    manager_information : list
-        A list of dictionaries containing filtered information about each manager in the league.
-        Each dictionary contains the following keys:
-            - 'entry': The unique ID of the manager.
-            - 'summary_overall_rank': The overall rank of the manager.
-            - 'player_region_iso_code_long': The ISO code of the player's region.
-            - 'favourite_team': The favourite team of the manager.
+    filtered_dict : dict
+        The manager's entry ID, overall rank, region ISO code and favourite team.
     """
-    urls = get_manager_urls(team_data=team_data)
-    all_results = fetch_urls_concurrently(urls=urls)
-
-    manager_information = []
-    for dictionary in all_results:
-        filtered_dict = {
-            "entry": dictionary.get("id"),
-            "summary_overall_rank": dictionary.get("summary_overall_rank"),
-            "player_region_iso_code_long": dictionary.get(
-                "player_region_iso_code_long"
-            ),
-            "favourite_team": dictionary.get("favourite_team"),
-        }
-        manager_information.append(filtered_dict)
-
-    return manager_information
+    filtered_dict = {
+        "entry": dictionary.get("id"),
+        "summary_overall_rank": dictionary.get("summary_overall_rank"),
+        "player_region_iso_code_long": dictionary.get("player_region_iso_code_long"),
+        "favourite_team": dictionary.get("favourite_team"),
+    }
+    return filtered_dict
 
 
 def get_team_urls(team_data):
@@ -388,58 +690,6 @@ def get_team_urls(team_data):
     urls = []
     for team in team_data:
         entry = team["entry"]
-        url = f"https://fantasy.premierleague.com/api/entry/{entry}/history/"
+        url = f"{api_url}/entry/{entry}/history/"
         urls.append(url)
     return urls
-
-
-def get_league_history(team_data):
-    """
-    Retrieves historical data for teams in a league based on team data.
-
-    This function takes a list of dictionaries containing team data as input and fetches historical data
-    for each team in the league. It generates URLs for fetching team history data using the provided team data
-    and fetches data from these URLs concurrently. Then, it enhances each historical data entry with additional
-    information including team ID, team name, and manager name.
-
-    Parameters
-    ----------
-    team_data : list
-        A list of dictionaries containing team data, including information about each team in the league.
-
-    Returns
-    -------
-    league_history : slist
-        A list of dictionaries containing historical data for all teams in the league.
-        Each dictionary represents a historical entry and includes the following keys:
-            - 'team_id': The unique ID of the team.
-            - 'team_name': The name of the team.
-            - 'manager_name': The name of the manager.
-            - Other historical data keys provided by the Fantasy Premier League API.
-    """
-
-    urls = get_team_urls(team_data=team_data)
-    all_results = fetch_urls_concurrently_with_url(urls=urls)
-
-    for result in all_results:
-        # Get the URL
-        url = result["url"]
-        # Extract team_id from URL
-        start_index = url.find("entry/") + len("entry/")
-        end_index = url.find("/history/")
-        team_id = url[start_index:end_index]
-        # Add team_id to each dictionary in the 'past' key
-        for item in result["data"]["past"]:
-            # Find the corresponding team data
-            for team in team_data:
-                if team["entry"] == int(team_id):
-                    # Add team_name and manager_name to the dictionary
-                    item["team_id"] = int(team_id)
-                    item["team_name"] = team["entry_name"]
-                    item["manager_name"] = team["player_name"]
-                    break
-
-    # Extract 'past' dictionaries into one big list
-    league_history = [item for result in all_results for item in result["data"]["past"]]
-
-    return league_history
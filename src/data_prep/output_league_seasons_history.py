@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 
 
@@ -5,12 +6,16 @@ def filter_rehsaped_season_history(season_start_year, df):
     """
     Filter the reshaped season history DataFrame based on a given start year.
 
+    The DataFrame is sorted by season_start, so the seasons to keep are found with a
+    binary search and returned as a slice of the DataFrame rather than a copy. The
+    slice must not be modified.
+
     Parameters
     ----------
     season_start_year : int
         The start year of the seasons to include.
     df : pandas.DataFrame
-        The reshaped season history DataFrame.
+        The reshaped season history DataFrame, sorted by season_start.
 
     Returns
     -------
@@ -18,187 +23,386 @@ def filter_rehsaped_season_history(season_start_year, df):
         The filtered DataFrame containing season history.
 
     """
-    df = df[df["season_name"].str[:4].astype(int) >= season_start_year]
+    start = df["season_start"].searchsorted(season_start_year, side="left")
+    df = df.iloc[start:]
 
     return df
 
 
-def get_seasons_by_positions(df, position, column_name):
+def join_seasons_by_team(team_codes, season_names, number_of_teams):
     """
-    Get seasons won, runners-up, or third-place finish for each team.
+    Join the season names of each team into a comma separated string.
 
     Parameters
     ----------
-    df : pandas.DataFrame
-        The DataFrame containing season data.
-    position : int
-        The position to filter the data by.
-    column_name : str
-        The name of the column to store the result.
+    team_codes : numpy.ndarray
+        The team code of each season, sorted.
+    season_names : numpy.ndarray
+        The season names, in the same order as team_codes.
+    number_of_teams : int
+        The number of team codes.
 
     Returns
     -------
-    df : pandas.DataFrame
-        A DataFrame containing seasons won, runners-up, or third-place finishes for each team.
+    seasons_joined : numpy.ndarray
+        The joined season names for each team code, NaN for teams with no seasons.
+
+    """
+    seasons_joined = np.full(number_of_teams, np.nan, dtype=object)
+
+    teams, starts = np.unique(team_codes, return_index=True)
+    stops = np.append(starts[1:], len(team_codes))
+    for team, start, stop in zip(teams, starts, stops):
+        seasons_joined[team] = ", ".join(season_names[start:stop])
+
+    return seasons_joined
+
+
+def get_suffix_sums(cells, shape, weights=None):
+    """
+    Sum values by season and team, then over each season and every later one.
+
+    Parameters
+    ----------
+    cells : numpy.ndarray
+        The season code times the number of teams plus the team code, for each value.
+    shape : tuple
+        The number of seasons and the number of teams.
+    weights : numpy.ndarray, optional
+        The values to sum, in the same order as cells, counted if not given.
+
+    Returns
+    -------
+    suffix_sums : numpy.ndarray
+        The sums for each start season and team, with a final row of zeros for
+        starting after the last season.
+
+    """
+    number_of_seasons, number_of_teams = shape
+    sums = np.bincount(
+        cells, weights=weights, minlength=number_of_seasons * number_of_teams
+    ).reshape(shape)
+
+    suffix_sums = np.zeros((number_of_seasons + 1, number_of_teams), dtype=sums.dtype)
+    suffix_sums[:-1] = sums[::-1].cumsum(axis=0)[::-1]
+
+    return suffix_sums
+
 
+def get_suffix_maximum(values, cells, shape):
     """
-    df = (
-        df[df["league_position"] == position]
-        .groupby(["team_name", "manager_name"])["season_name"]
-        .apply(lambda x: ", ".join(map(str, x)))
-        .reset_index(name=column_name)
+    Take the maximum value by season and team, then over each season and every later one.
+
+    Parameters
+    ----------
+    values : numpy.ndarray
+        The values, NaN where missing.
+    cells : numpy.ndarray
+        The season code times the number of teams plus the team code, for each value.
+    shape : tuple
+        The number of seasons and the number of teams.
+
+    Returns
+    -------
+    suffix_maximum : numpy.ndarray
+        The maximum for each start season and team, -inf if every value is missing,
+        with a final row for starting after the last season.
+    suffix_maximum_season : numpy.ndarray
+        The code of the earliest season the maximum was reached in.
+
+    """
+    number_of_seasons, number_of_teams = shape
+    maximum = np.full(number_of_seasons * number_of_teams, -np.inf)
+    np.fmax.at(maximum, cells, values)
+    maximum = maximum.reshape(shape)
+
+    # Work back from the last season, so ties go to the earlier season
+    suffix_maximum = np.full((number_of_seasons + 1, number_of_teams), -np.inf)
+    suffix_maximum_season = np.zeros(
+        (number_of_seasons + 1, number_of_teams), dtype=int
     )
+    for season in range(number_of_seasons - 1, -1, -1):
+        is_maximum = maximum[season] >= suffix_maximum[season + 1]
+        suffix_maximum[season] = np.where(
+            is_maximum, maximum[season], suffix_maximum[season + 1]
+        )
+        suffix_maximum_season[season] = np.where(
+            is_maximum, season, suffix_maximum_season[season + 1]
+        )
 
-    return df
+    return suffix_maximum, suffix_maximum_season
 
 
-def get_season_overview(df, manager_information, team_ids):
+def get_team_season_statistics_by_start(df):
     """
-    Generate an overview of the performance of teams across seasons.
+    Precompute the statistics of each team for every start season.
 
-    This function aggregates various statistics for each team across seasons, including the number of times they won, were runners-up or finished third, the total number of seasons played, the maximum points achieved in a season, the minimum rank attained in a season, and more.
+    The statistics of each team are built up from the last season backwards (suffix
+    aggregates), so every season holds the team's statistics over that season and all
+    later ones. The statistics from any start year are then looked up with
+    get_team_season_statistics_from_start rather than aggregated again.
 
     Parameters
     ----------
     df : pandas.DataFrame
-        The DataFrame containing data about teams' performances across seasons.
-    manager_information : list
-        Information about managers for all teams in the league.
-    team_ids : pandas.DataFrame
-        DataFrame containing team IDs and corresponding team names.
+        The reshaped season history DataFrame, sorted by season_start.
 
     Returns
     -------
-    seasons_overview : pandas.DataFrame
-        A DataFrame summarizing the performance of teams across seasons, including aggregated statistics.
+    statistics_by_start : dict
+        The start year of each season, and for every start season and team the
+        counts, totals and best points and rank with the season they were achieved
+        in, along with the team names and season names to label them.
 
     """
-    # Get max value
-    max_points_season_index = df.groupby("team_name")["total_points"].idxmax()
-
-    # Create a DataFrame with both 'team' and 'ranking' columns for each group
-    max_points_season_df = df.loc[
-        max_points_season_index, ["team_name", "manager_name", "season_name"]
-    ]
-    max_points_season_df.rename(
-        columns={"season_name": "max_points_season_year"}, inplace=True
+    # Integer codes for teams, in team ID order, and seasons, in the order they appear
+    team_codes, team_index = pd.factorize(df["team_id"], sort=True)
+    season_codes, season_index = pd.factorize(df["season_name"])
+    shape = (len(season_index), len(team_index))
+    cells = season_codes * len(team_index) + team_codes
+
+    position = df["league_position"].to_numpy()
+    points = df["total_points"].to_numpy()
+    rank = df["rank"].to_numpy(dtype="float64", na_value=np.nan)
+    has_rank = ~np.isnan(rank)
+
+    # First row of each team and season, for their names
+    team_rows = np.unique(team_codes, return_index=True)[1]
+    season_rows = np.unique(season_codes, return_index=True)[1]
+
+    # Best points and rank, the rank negated so the best is the maximum
+    maximum_points, maximum_points_season = get_suffix_maximum(
+        values=points, cells=cells, shape=shape
+    )
+    minimum_rank, minimum_rank_season = get_suffix_maximum(
+        values=-rank, cells=cells, shape=shape
     )
 
-    # Get max value
-    min_rank_season_index = df.groupby("team_name")["rank"].idxmin()
+    # Seasons joined in full for each team, and the length of the joined seasons from
+    # each start season, so the joined seasons from a start are the end of the string
+    order = np.argsort(team_codes, kind="stable")
+    season_names = df["season_name"].astype(str).to_numpy()
+    name_lengths = np.array([len(name) + 2 for name in season_names[season_rows]])
+
+    statistics_by_start = {
+        "season_start": df["season_start"].to_numpy()[season_rows],
+        "season_name": df["season_name"].take(season_rows).reset_index(drop=True),
+        "team_id": df["team_id"].take(team_rows).to_numpy(),
+        "team_name": df["team_name"].take(team_rows).reset_index(drop=True),
+        "manager_name": df["manager_name"].take(team_rows).reset_index(drop=True),
+        "points_dtype": points.dtype,
+        "rank_dtype": df["rank"].dtype,
+        "season_counts": get_suffix_sums(cells=cells, shape=shape),
+        "seasons_played": get_suffix_sums(cells=np.unique(cells), shape=shape),
+        "maximum_points": maximum_points,
+        "maximum_points_season": maximum_points_season,
+        "minimum_rank": -minimum_rank,
+        "minimum_rank_season": minimum_rank_season,
+        "total_points": get_suffix_sums(
+            cells=cells, shape=shape, weights=points
+        ).astype("int64"),
+        "rank_total": get_suffix_sums(
+            cells=cells[has_rank], shape=shape, weights=rank[has_rank]
+        ),
+        "rank_counts": get_suffix_sums(cells=cells[has_rank], shape=shape),
+    }
 
-    # Create a DataFrame with both 'team' and 'ranking' columns for each group
-    min_rank_season_df = df.loc[
-        min_rank_season_index, ["team_name", "manager_name", "season_name"]
-    ]
-    min_rank_season_df.rename(
-        columns={"season_name": "min_rank_season_year"}, inplace=True
-    )
+    # Seasons finished in each of the top three positions, and the joined seasons for
+    # every season played and each position
+    for position_number, column_name in [
+        (None, "seasons_played_years"),
+        (1, "seasons_won_years"),
+        (2, "seasons_runner_up_years"),
+        (3, "seasons_third_years"),
+    ]:
+        is_position = np.ones(len(df), dtype=bool)
+        if position_number is not None:
+            is_position = position == position_number
+            statistics_by_start[column_name.replace("_years", "")] = get_suffix_sums(
+                cells=cells[is_position], shape=shape
+            )
+
+        is_sorted_position = is_position[order]
+        statistics_by_start[column_name] = join_seasons_by_team(
+            team_codes=team_codes[order][is_sorted_position],
+            season_names=season_names[order][is_sorted_position],
+            number_of_teams=len(team_index),
+        )
+        statistics_by_start[f"{column_name}_lengths"] = get_suffix_sums(
+            cells=cells[is_position],
+            shape=shape,
+            weights=name_lengths[season_codes[is_position]],
+        ).astype("int64")
 
-    # Group by 'team' and aggregate values of 'score' column into a string
-    seasons_played = (
-        df.groupby(["team_name", "manager_name"])["season_name"]
-        .apply(lambda x: ", ".join(map(str, x)))
-        .reset_index(name="seasons_played_years")
-    )
+    return statistics_by_start
 
-    seasons_first = get_seasons_by_positions(
-        df=df, position=1, column_name="seasons_won_years"
-    )
 
-    seasons_second = get_seasons_by_positions(
-        df=df, position=2, column_name="seasons_runner_up_years"
-    )
+def get_team_season_statistics_from_start(statistics_by_start, season_start_year=None):
+    """
+    Look up the statistics of each team from a start year.
 
-    seasons_third = get_seasons_by_positions(
-        df=df, position=3, column_name="seasons_third_years"
-    )
+    Parameters
+    ----------
+    statistics_by_start : dict
+        The output of get_team_season_statistics_by_start.
+    season_start_year : int, optional
+        The start year of the seasons to include, every season if not given.
 
-    # Get aggregated stats
-    seasons_overview = (
-        df.groupby(["team_id", "team_name", "manager_name"])
-        .agg(
-            seasons_won=("league_position", lambda x: (x == 1).sum()),
-            seasons_runner_up=("league_position", lambda x: (x == 2).sum()),
-            seasons_third=("league_position", lambda x: (x == 3).sum()),
-            seasons_played=("season_name", "nunique"),
-            maximum_points=("total_points", "max"),
-            minimum_rank=("rank", "min"),
+    Returns
+    -------
+    team_statistics : pandas.DataFrame
+        One row per team with seasons from the start year, in team ID order, with the
+        number of seasons won, runner-up, third and played, the best points and rank
+        with the seasons they were achieved in, the seasons played, won, runner-up and
+        third as comma separated strings, and the total and average points and average
+        rank.
+
+    """
+    start = 0
+    if season_start_year is not None:
+        start = np.searchsorted(
+            statistics_by_start["season_start"], season_start_year, side="left"
         )
-        .reset_index()
+
+    season_counts = statistics_by_start["season_counts"][start]
+    teams = np.flatnonzero(season_counts > 0)
+    season_counts = season_counts[teams]
+
+    def get_values(name):
+        return statistics_by_start[name][start, teams]
+
+    has_rank = get_values("minimum_rank") < np.inf
+    minimum_rank = np.where(has_rank, get_values("minimum_rank"), np.nan)
+    season_name = statistics_by_start["season_name"]
+
+    team_statistics = pd.DataFrame(
+        {
+            "team_id": statistics_by_start["team_id"][teams],
+            "team_name": statistics_by_start["team_name"]
+            .take(teams)
+            .reset_index(drop=True),
+            "manager_name": statistics_by_start["manager_name"]
+            .take(teams)
+            .reset_index(drop=True),
+            "seasons_won": get_values("seasons_won"),
+            "seasons_runner_up": get_values("seasons_runner_up"),
+            "seasons_third": get_values("seasons_third"),
+            "seasons_played": get_values("seasons_played"),
+            "maximum_points": get_values("maximum_points").astype(
+                statistics_by_start["points_dtype"]
+            ),
+            "minimum_rank": pd.Series(minimum_rank).astype(
+                statistics_by_start["rank_dtype"]
+            ),
+            "max_points_season_year": season_name.take(
+                get_values("maximum_points_season")
+            ).reset_index(drop=True),
+            "min_rank_season_year": season_name.take(get_values("minimum_rank_season"))
+            .reset_index(drop=True)
+            .where(has_rank),
+        }
     )
 
-    # Join together
-    seasons_overview = (
-        seasons_overview.merge(
-            right=max_points_season_df, on=["team_name", "manager_name"], how="left"
-        )
-        .merge(right=min_rank_season_df, on=["team_name", "manager_name"], how="left")
-        .merge(right=seasons_played, on=["team_name", "manager_name"], how="left")
-        .merge(right=seasons_first, on=["team_name", "manager_name"], how="left")
-        .merge(right=seasons_second, on=["team_name", "manager_name"], how="left")
-        .merge(right=seasons_third, on=["team_name", "manager_name"], how="left")
-        .merge(
-            right=pd.DataFrame(manager_information),
-            left_on=["team_id"],
-            right_on=["entry"],
-            how="left",
-        )
-        .merge(right=team_ids, left_on=["favourite_team"], right_on=["id"], how="left")
-        .sort_values(
-            ["seasons_won", "seasons_runner_up", "seasons_third"], ascending=False
+    # The joined seasons from the start season are the end of the joined seasons
+    for column_name in [
+        "seasons_played_years",
+        "seasons_won_years",
+        "seasons_runner_up_years",
+        "seasons_third_years",
+    ]:
+        seasons_joined = statistics_by_start[column_name][teams]
+        lengths = get_values(f"{column_name}_lengths") - 2
+        team_statistics[column_name] = np.array(
+            [
+                joined[len(joined) - length :] if length > 0 else np.nan
+                for joined, length in zip(seasons_joined, lengths)
+            ],
+            dtype=object,
         )
-    )
 
-    # Add rank
-    seasons_overview["rank"] = (
-        seasons_overview["seasons_won"]
-        .rank(method="min", ascending=False)
-        .astype("int")
+    total_points = get_values("total_points")
+    team_statistics["total_points"] = total_points
+    team_statistics["average_points"] = total_points / season_counts
+    team_statistics["average_rank"] = get_values("rank_total") / get_values(
+        "rank_counts"
     )
 
-    return seasons_overview
+    return team_statistics
+
+
+def get_team_season_statistics(df):
+    """
+    Aggregate the seasons of each team.
 
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        The reshaped season history DataFrame, sorted by season_start.
+
+    Returns
+    -------
+    team_statistics : pandas.DataFrame
+        The statistics of each team over every season in df, as returned by
+        get_team_season_statistics_from_start.
 
-def aggreagte_season_by_position(position, df, column_name):
     """
-    Aggregate seasons based on the finishing position of teams.
+    team_statistics = get_team_season_statistics_from_start(
+        statistics_by_start=get_team_season_statistics_by_start(df=df)
+    )
 
-    This function filters the DataFrame to include only the teams that finished in the specified position across seasons. It then assigns a cumulative count to each appearance of a team in that position and creates a new column with the manager's name, team name, and cumulative count.
+    return team_statistics
 
 
+def get_season_overview(df, manager_information, team_ids, team_statistics=None):
+    """
+    Generate an overview of the performance of teams across seasons.
+
+    This function aggregates various statistics for each team across seasons, including the number of times they won, were runners-up or finished third, the total number of seasons played, the maximum points achieved in a season, the minimum rank attained in a season, and more.
 
     Parameters
     ----------
-    position : int
-        The position to filter the data by.
     df : pandas.DataFrame
-        The DataFrame containing season data.
-    column_name : str
-        The name of the column to store the result.
+        The DataFrame containing data about teams' performances across seasons.
+    manager_information : list
+        Information about managers for all teams in the league.
+    team_ids : pandas.DataFrame
+        DataFrame containing team IDs and corresponding team names.
+    team_statistics : pandas.DataFrame, optional
+        The output of get_team_season_statistics for df, computed if not given.
 
     Returns
     -------
-    df : pandas.DataFrame
-        A DataFrame containing aggregated season data by position.
+    seasons_overview : pandas.DataFrame
+        A DataFrame summarizing the performance of teams across seasons, including aggregated statistics.
 
     """
-    df = df[df["league_position"] == position]
-    df["Cumulative_Count"] = df.groupby("team_name").cumcount() + 1
+    if team_statistics is None:
+        team_statistics = get_team_season_statistics(df=df)
 
-    df["team_name"] = df["team_name"] + " (" + df["Cumulative_Count"].astype(str) + ")"
+    seasons_overview = team_statistics
 
-    df = df[["season_name", "manager_name", "team_name"]]
+    # Join with manager information and favourite teams
+    seasons_overview = (
+        seasons_overview.merge(
+            right=pd.DataFrame(manager_information),
+            left_on=["team_id"],
+            right_on=["entry"],
+            how="left",
+        )
+        .merge(right=team_ids, left_on=["favourite_team"], right_on=["id"], how="left")
+        .sort_values(
+            ["seasons_won", "seasons_runner_up", "seasons_third"], ascending=False
+        )
+    )
 
-    rename_columns = {
-        "season_name": "Season",
-        "manager_name": f"{column_name}: Manager",
-        "team_name": f"{column_name}: Team ",
-        "third_place_with_count": "Third Place",
-    }
-    df = df.rename(columns=rename_columns)
+    # Add rank
+    seasons_overview["rank"] = (
+        seasons_overview["seasons_won"]
+        .rank(method="min", ascending=False)
+        .astype("int")
+    )
 
-    return df
+    return seasons_overview
 
 
 def get_seasons_by_top_three_teams(df):
@@ -207,6 +411,9 @@ def get_seasons_by_top_three_teams(df):
 
     This function aggregates information about the seasons where teams finished in the top three positions (champions, runners-up, and third place). It provides a summary of the number of times each team achieved these positions across seasons.
 
+    The top three of every season are selected once, counted once and pivoted into one
+    row per season. Teams tied on a position are listed on rows of their own.
+
     Parameters
     ----------
     df : pandas.DataFrame
@@ -218,18 +425,47 @@ def get_seasons_by_top_three_teams(df):
         A DataFrame summarizing the performance of top three teams across seasons.
 
     """
-    champions = aggreagte_season_by_position(position=1, df=df, column_name="Champions")
-    runners_up = aggreagte_season_by_position(
-        position=2, df=df, column_name="Runners-up"
+    position_names = {1: "Champions", 2: "Runners-up", 3: "Third Place"}
+
+    top_three = df[df["league_position"] <= 3]
+
+    # Number of times each team has finished in the position so far, e.g. "Team (2)"
+    cumulative_count = (
+        top_three.groupby(["league_position", "team_name"], observed=True).cumcount()
+        + 1
     )
-    third_place = aggreagte_season_by_position(
-        position=3, df=df, column_name="Third Place"
+
+    top_three = pd.DataFrame(
+        {
+            "Season": top_three["season_name"].astype(str),
+            "position": top_three["league_position"],
+            "Manager": top_three["manager_name"].astype(str),
+            "Team ": top_three["team_name"].astype(str)
+            + " ("
+            + cumulative_count.astype(str)
+            + ")",
+        }
     )
 
-    seasons_top_three = (
-        champions.merge(right=runners_up, on="Season", how="left")
-        .merge(right=third_place, on="Season", how="left")
-        .sort_values(by="Season")
+    # Teams sharing a position in a season go on separate rows
+    top_three["tie"] = top_three.groupby(["Season", "position"]).cumcount()
+
+    seasons_top_three = top_three.pivot(
+        index=["Season", "tie"], columns="position", values=["Manager", "Team "]
+    )
+
+    columns = [
+        (value, position)
+        for position in position_names
+        for value in ["Manager", "Team "]
+    ]
+    seasons_top_three = seasons_top_three.reindex(columns=columns).astype(object)
+    seasons_top_three.columns = [
+        f"{position_names[position]}: {value}" for value, position in columns
+    ]
+
+    seasons_top_three = seasons_top_three.reset_index(level="Season").reset_index(
+        drop=True
     )
 
     # Fill nulls
@@ -277,8 +513,8 @@ def get_titles_won_summary(df):
     }
     df = df.rename(columns=rename_columns)
 
-    # Fill nulls
-    df = df.fillna("")
+    # Fill nulls, only the seasons text can be missing
+    df = df.fillna({"Winning Seasons": ""})
 
     return df
 
@@ -287,7 +523,9 @@ def reformat_season_overview(df):
     """
     Reformat the season overview DataFrame.
 
-    This function renames columns, formats certain columns, and transposes the DataFrame for better presentation.
+    This function renames columns and formats certain columns for better presentation,
+    keeping one row per team so it can be paged and searched however many teams there
+    are. get_team_comparison sets a few teams side by side.
 
     Parameters
     ----------
@@ -297,7 +535,8 @@ def reformat_season_overview(df):
     Returns
     -------
     df : pandas.DataFrame
-        A reformatted DataFrame presenting season overview information.
+        A reformatted DataFrame presenting season overview information, one row per
+        team indexed by team ID.
 
     """
     rename_columns = {
@@ -321,13 +560,13 @@ def reformat_season_overview(df):
     df["Best Points in a Season"] = (
         df["Best Points in a Season"].map("{:,.0f}".format)
         + " ("
-        + df["max_points_season_year"]
+        + df["max_points_season_year"].astype(str)
         + ")"
     )
     df["Best Rank in a Season"] = (
         df["Best Rank in a Season"].map("{:,.0f}".format)
         + " ("
-        + df["min_rank_season_year"]
+        + df["min_rank_season_year"].astype(str)
         + ")"
     )
 
@@ -337,18 +576,50 @@ def reformat_season_overview(df):
         .replace("Burnley", "That's the Burnley Way")
     )
 
-    # Re order columns
-    df = df[list(rename_columns.values())]
-
-    # Transpose
-    df = df.T
+    # Re order columns, one row per team
+    df = df.set_index("team_id")[list(rename_columns.values())]
 
-    # Fill nulls
+    # Fill nulls, categories only holding their values
+    category_columns = df.select_dtypes("category").columns
+    df[category_columns] = df[category_columns].astype(object)
     df = df.fillna("")
 
     return df
 
 
+def get_team_comparison(df, team_ids):
+    """
+    Set the summary statistics of a few teams side by side.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        The output of reformat_season_overview.
+    team_ids : list of int
+        The IDs of the teams to compare, in the order to show them.
+
+    Returns
+    -------
+    team_comparison : pandas.DataFrame
+        A DataFrame of text with a row per statistic and a column per team, labelled by team
+        name, or by team and manager name where team names are shared.
+    """
+    df = df.loc[[team_id for team_id in dict.fromkeys(team_ids) if team_id in df.index]]
+
+    team_labels = df["Team"].astype(str)
+    shared_names = team_labels.duplicated(keep=False)
+    team_labels[shared_names] = (
+        team_labels[shared_names] + " (" + df["Manager"].astype(str) + ")"
+    )
+
+    team_comparison = df.drop(columns=["Team"]).astype(str).T
+    team_comparison.columns = team_labels.tolist()
+    team_comparison.insert(0, "Statistic", team_comparison.index)
+    team_comparison = team_comparison.reset_index(drop=True)
+
+    return team_comparison
+
+
 def reformat_season_history(df):
     """
     Reformat the season history DataFrame.
@@ -382,7 +653,7 @@ def reformat_season_history(df):
     return df
 
 
-def get_all_time_table(df):
+def get_all_time_table(df, team_statistics=None):
     """
     Generate an all-time table summarizing performance across seasons.
 
@@ -393,6 +664,8 @@ def get_all_time_table(df):
     ----------
     df : pandas.DataFrame
         DataFrame containing historical performance data across seasons.
+    team_statistics : pandas.DataFrame, optional
+        The output of get_team_season_statistics for df, computed if not given.
 
     Returns
     -------
@@ -400,26 +673,23 @@ def get_all_time_table(df):
         A DataFrame representing the all-time table, including columns for Manager, Team, Total Points, Average Points,
         Total Seasons Played, and Average Rank, sorted by Total Points in descending order.
     """
-    all_time_table = (
-        df.groupby(["manager_name", "team_name"])
-        .agg(
-            {
-                "total_points": ["sum", "mean"],
-                "season_name": "nunique",
-                "rank": "mean",
-            }
-        )
-        .reset_index()
+    if team_statistics is None:
+        team_statistics = get_team_season_statistics(df=df)
+
+    # Order by manager and team, as grouping by them would
+    all_time_table = team_statistics.sort_values(
+        ["manager_name", "team_name"], kind="stable", ignore_index=True
     )
 
-    all_time_table.columns = [
-        "Manager",
-        "Team",
-        "Total Points",
-        "Average Points",
-        "Total Seasons Played",
-        "Average Rank",
-    ]
+    rename_columns = {
+        "manager_name": "Manager",
+        "team_name": "Team",
+        "total_points": "Total Points",
+        "average_points": "Average Points",
+        "seasons_played": "Total Seasons Played",
+        "average_rank": "Average Rank",
+    }
+    all_time_table = all_time_table[list(rename_columns)].rename(columns=rename_columns)
 
     all_time_table = all_time_table.sort_values(by="Total Points", ascending=False)
 
@@ -1,7 +1,31 @@
-import inflect
+import numpy as np
 import pandas as pd
 
 
+def format_ordinal(number):
+    """
+    Format a whole number as an ordinal, e.g. 1st, 2nd, 3rd, 4th, 11th or 21st.
+
+    Parameters
+    ----------
+    number : int
+        The number to format.
+
+    Returns
+    -------
+    ordinal : str
+        The number followed by its ordinal suffix.
+
+    """
+    if 10 <= number % 100 <= 20:
+        suffix = "th"
+    else:
+        suffix = {1: "st", 2: "nd", 3: "rd"}.get(number % 10, "th")
+
+    ordinal = f"{number}{suffix}"
+    return ordinal
+
+
 def get_current_champions(df, season_overview):
     """
     Retrieve information about the current champions.
@@ -11,7 +35,7 @@ def get_current_champions(df, season_overview):
     Parameters
     ----------
     df : pandas.DataFrame
-        DataFrame containing season data.
+        DataFrame containing season data, sorted by season_start and league position.
     season_overview : pandas.DataFrame
         DataFrame summarizing the performance of teams across seasons.
 
@@ -21,18 +45,21 @@ def get_current_champions(df, season_overview):
         A string describing the current champions.
 
     """
-    current_champions_index = df["season_name"].idxmax()
+    # The champions are the first row of the latest season
+    season_start = df["season_start"].to_numpy()
+    current_champions_index = season_start.searchsorted(season_start[-1], side="left")
 
-    current_champions_team_name = df.loc[current_champions_index, "team_name"]
-    current_champions_manager_name = df.loc[current_champions_index, "manager_name"]
-    current_champions_season_name = df.loc[current_champions_index, "season_name"]
+    current_champions_team_id = df["team_id"].iloc[current_champions_index]
+    current_champions_team_name = df["team_name"].iloc[current_champions_index]
+    current_champions_manager_name = df["manager_name"].iloc[current_champions_index]
+    current_champions_season_name = df["season_name"].iloc[current_champions_index]
 
     # Get title number and append "st", "nd", "rd" for "1st", "2nd", "3rd" etc.
-    title_number = season_overview.loc[
-        season_overview["team_name"] == current_champions_team_name, "seasons_won"
-    ]
-    p = inflect.engine()
-    title_number = p.ordinal(int(title_number))
+    is_current_champions = (
+        season_overview["team_id"].to_numpy() == current_champions_team_id
+    )
+    title_number = season_overview["seasons_won"].to_numpy()[is_current_champions][0]
+    title_number = format_ordinal(int(title_number))
 
     current_champions = f"{current_champions_manager_name}: {current_champions_team_name} ({title_number} title) ({current_champions_season_name})"
 
@@ -56,18 +83,15 @@ def get_most_wins(df):
         A string describing the teams with the most championships.
 
     """
-    most_seasons_won = df["seasons_won"].max()
-
-    most_season_won_teams = df.loc[
-        df["seasons_won"] == most_seasons_won,
-        ["manager_name", "team_name", "seasons_won"],
-    ].to_dict(orient="records")
+    all_seasons_won = df["seasons_won"].to_numpy()
+    most_season_won_rows = np.flatnonzero(all_seasons_won == all_seasons_won.max())
 
     most_season_won_teams_list = []
-    for team in most_season_won_teams:
-        manager_name = team["manager_name"]
-        team_name = team["team_name"]
-        seasons_won = team["seasons_won"]
+    for manager_name, team_name, seasons_won in zip(
+        df["manager_name"].iloc[most_season_won_rows],
+        df["team_name"].iloc[most_season_won_rows],
+        all_seasons_won[most_season_won_rows],
+    ):
         teams_str = f"{manager_name}: {team_name} ({seasons_won} titles)"
         most_season_won_teams_list.append(teams_str)
     most_season_won_teams_str = "; ".join(most_season_won_teams_list)
@@ -78,12 +102,12 @@ def get_best_rank_points(df, column):
     """
     Retrieve information about teams achieving the best rank or points.
 
-    This function identifies the teams that achieved the best rank or the most points in a season based on the provided DataFrame containing season data. It returns a string describing the teams, including the manager's name, team name, the best rank or points achieved, and the season.
+    This function identifies the teams that achieved the best rank or the most points in a season from each team's best season in the season overview. It returns a string describing the teams, including the manager's name, team name, the best rank or points achieved, and the season, earliest season first. A team that reached the best value in more than one season is listed with the earliest.
 
     Parameters
     ----------
     df : pandas.DataFrame
-        DataFrame containing season data.
+        DataFrame summarizing the performance of teams across seasons.
     column : str
         Column name indicating the criteria (rank or total points).
 
@@ -94,23 +118,34 @@ def get_best_rank_points(df, column):
 
     """
     if column == "rank":
-        best = df[column].min()
+        values = df["minimum_rank"].to_numpy(dtype="float64", na_value=np.nan)
+        season_names = df["min_rank_season_year"]
+        best = np.nanmin(values)
         column_alias = "Rank"
     elif column == "total_points":
-        best = df[column].max()
+        values = df["maximum_points"].to_numpy(dtype="float64", na_value=np.nan)
+        season_names = df["max_points_season_year"]
+        best = np.nanmax(values)
         column_alias = "Points"
 
-    best_teams = df.loc[
-        df[column] == best,
-        ["manager_name", "team_name", "rank", "total_points", "season_name"],
-    ].to_dict(orient="records")
+    # Order by season then team ID, season names sort by year, e.g. "2019/20" first
+    best_rows = np.flatnonzero(values == best)
+    best_rows = best_rows[
+        np.lexsort(
+            (
+                df["team_id"].to_numpy()[best_rows],
+                season_names.iloc[best_rows].to_numpy(dtype=str),
+            )
+        )
+    ]
+    best_value = "{:,}".format(int(best))
 
     best_teams_list = []
-    for team in best_teams:
-        manager_name = team["manager_name"]
-        team_name = team["team_name"]
-        best_value = "{:,}".format(team[column])
-        season_name = team["season_name"]
+    for manager_name, team_name, season_name in zip(
+        df["manager_name"].iloc[best_rows],
+        df["team_name"].iloc[best_rows],
+        season_names.iloc[best_rows],
+    ):
         teams_str = (
             f"{manager_name}: {team_name}: {column_alias}: {best_value} ({season_name})"
         )
@@ -151,15 +186,14 @@ def get_first_Season_year_data(df):
     Parameters
     ----------
     df : pandas.DataFrame
-        DataFrame containing season data.
+        DataFrame containing season data, sorted by season_start.
 
     Returns
     -------
     first_Season_year_data : str
         The year of the first season in the DataFrame.
     """
-    first_Season_year_data = df["season_name"].min()
-    first_Season_year_data = first_Season_year_data[0:4]
+    first_Season_year_data = str(df["season_start"].iloc[0])
     return first_Season_year_data
 
 
@@ -226,3 +260,47 @@ def get_league_summary_kpis(
     }
     league_summary_kpis = pd.DataFrame(data=d, index=[0]).T
     return league_summary_kpis
+
+
+def get_league_summary(df, season_overview, team_data, league_data):
+    """
+    Generate the league name and every key performance indicator (KPI) of the league.
+
+    Each KPI is read from the per-team aggregates in season_overview, or from the
+    first or last season of df, and only the teams that make the summary are
+    formatted.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        DataFrame containing season data, sorted by season_start and league position.
+    season_overview : pandas.DataFrame
+        DataFrame summarizing the performance of teams across seasons.
+    team_data : list
+        List containing data about the league.
+    league_data : dict
+        Dictionary containing data about the league.
+
+    Returns
+    -------
+    league_name : str
+        The name of the league.
+    league_summary_kpis : pandas.DataFrame
+        A DataFrame summarizing key performance indicators for the league.
+    """
+    league_summary_kpis = get_league_summary_kpis(
+        first_Season_year_data=get_first_Season_year_data(df=df),
+        number_of_teams_league=get_number_of_teams_league(team_data=team_data),
+        current_champions_output=get_current_champions(
+            df=df, season_overview=season_overview
+        ),
+        most_season_won_teams_str_output=get_most_wins(df=season_overview),
+        best_points_teams_str_output=get_best_rank_points(
+            df=season_overview, column="total_points"
+        ),
+        best_rank_teams_str=get_best_rank_points(df=season_overview, column="rank"),
+    )
+
+    league_name = get_league_name(league_data=league_data)
+
+    return league_name, league_summary_kpis
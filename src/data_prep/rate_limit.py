@@ -0,0 +1,234 @@
+import asyncio
+import random
+import statistics
+import threading
+import time
+from urllib.parse import urlsplit
+
+# Requests per second allowed to each host, and the burst allowed above that rate
+requests_per_second = 250
+burst = 250
+
+# Bounds on requests in flight to each host, adapted between these as responses arrive
+min_concurrency = 4
+initial_concurrency = 16
+max_concurrency = 64
+
+# Minimum seconds between concurrency cuts, so one burst of errors counts once
+decrease_interval = 1.0
+
+# Retries for throttled, failed or unreachable requests
+max_retries = 4
+backoff_base = 0.5
+backoff_max = 8.0
+
+# Completed requests needed before stragglers are hedged, how often to check for them,
+# and the most duplicates sent for one request
+hedge_min_samples = 20
+hedge_check_interval = 0.05
+max_hedges = 2
+
+_limiters = {}
+_limiters_lock = threading.Lock()
+
+
+class HostLimiter:
+    """
+    Rate and concurrency limiter for requests to one host.
+
+    A token bucket caps the request rate. The number of requests in flight is
+    adapted AIMD-style: each healthy response raises the limit by roughly one per
+    window of requests, and a throttled (429), server error (5xx) or failed
+    response halves it.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._concurrency = float(initial_concurrency)
+        self._in_flight = 0
+        self._last_decrease = 0.0
+
+    def try_acquire(self, hedge=False):
+        """
+        Reserves a request slot if one is available now.
+
+        Parameters
+        ----------
+        hedge : bool, optional
+            Whether the request duplicates a straggler. Hedged requests still take a
+            token, but are not held back by the stragglers filling the concurrency limit.
+
+        Returns
+        -------
+        wait : float
+            0 if the slot was reserved, otherwise the seconds to wait before trying again.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                burst, self._tokens + (now - self._updated) * requests_per_second
+            )
+            self._updated = now
+
+            if not hedge and self._in_flight >= int(self._concurrency):
+                return 0.01
+            if self._tokens < 1:
+                return (1 - self._tokens) / requests_per_second
+
+            self._tokens -= 1
+            self._in_flight += 1
+            return 0
+
+    def acquire(self, deadline=None, hedge=False):
+        """
+        Blocks until a request slot is reserved or the deadline passes.
+
+        Parameters
+        ----------
+        deadline : float, optional
+            The time.monotonic() time to stop waiting at.
+        hedge : bool, optional
+            Whether the request duplicates a straggler.
+
+        Returns
+        -------
+        bool
+            True if the slot was reserved.
+        """
+        wait = self.try_acquire(hedge=hedge)
+        while wait:
+            if deadline is not None and time.monotonic() + wait > deadline:
+                return False
+            time.sleep(wait)
+            wait = self.try_acquire(hedge=hedge)
+        return True
+
+    async def acquire_async(self, deadline=None, hedge=False):
+        """
+        Waits on the event loop until a request slot is reserved or the deadline passes.
+
+        Parameters
+        ----------
+        deadline : float, optional
+            The time.monotonic() time to stop waiting at.
+        hedge : bool, optional
+            Whether the request duplicates a straggler.
+
+        Returns
+        -------
+        bool
+            True if the slot was reserved.
+        """
+        wait = self.try_acquire(hedge=hedge)
+        while wait:
+            if deadline is not None and time.monotonic() + wait > deadline:
+                return False
+            await asyncio.sleep(wait)
+            wait = self.try_acquire(hedge=hedge)
+        return True
+
+    def release(self, status):
+        """
+        Frees a request slot and adapts the concurrency limit to the outcome.
+
+        Parameters
+        ----------
+        status : int or None
+            The HTTP status of the response, or None if the request failed to complete.
+        """
+        with self._lock:
+            self._in_flight -= 1
+
+            if status is None or is_retryable_status(status):
+                now = time.monotonic()
+                if now - self._last_decrease >= decrease_interval:
+                    self._concurrency = max(min_concurrency, self._concurrency / 2)
+                    self._last_decrease = now
+            else:
+                self._concurrency = min(
+                    max_concurrency, self._concurrency + 1 / self._concurrency
+                )
+
+
+def get_limiter(url):
+    """
+    Returns the shared limiter for the host of a URL, creating it on first use.
+
+    Parameters
+    ----------
+    url : str
+        The URL to be requested.
+
+    Returns
+    -------
+    limiter : HostLimiter
+        The limiter for the URL's host.
+    """
+    host = urlsplit(url).netloc
+
+    with _limiters_lock:
+        if host not in _limiters:
+            _limiters[host] = HostLimiter()
+        return _limiters[host]
+
+
+def is_retryable_status(status):
+    """
+    Checks whether a response status is worth retrying.
+
+    Parameters
+    ----------
+    status : int
+        The HTTP status of the response.
+
+    Returns
+    -------
+    bool
+        True for throttled (429) and server error (5xx) responses.
+    """
+    return status == 429 or status >= 500
+
+
+def get_backoff(attempt, retry_after=None):
+    """
+    Returns the seconds to wait before retrying a request, with full jitter.
+
+    Parameters
+    ----------
+    attempt : int
+        The number of the attempt that failed, starting from 0.
+    retry_after : str, optional
+        The Retry-After header of the response, honoured when given in seconds.
+
+    Returns
+    -------
+    float
+        The seconds to wait.
+    """
+    backoff = random.uniform(0, min(backoff_max, backoff_base * 2**attempt))
+
+    if retry_after is not None and retry_after.isdigit():
+        backoff = max(backoff, float(retry_after))
+
+    return backoff
+
+
+def get_hedge_delay(latencies):
+    """
+    Returns how long a request may run before a duplicate is sent for it.
+
+    Parameters
+    ----------
+    latencies : list
+        The seconds taken by completed requests.
+
+    Returns
+    -------
+    float or None
+        The 95th percentile latency, or None until hedge_min_samples requests have completed.
+    """
+    if len(latencies) < hedge_min_samples:
+        return None
+    return statistics.quantiles(latencies, n=20)[-1]
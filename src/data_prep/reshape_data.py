@@ -1,5 +1,42 @@
 import pandas as pd
 
+# Compact column types for the season frames: repeated strings as categories (season
+# names ordered, so min and max work), small integers narrowed, and nullable integers
+# where a value can be missing
+season_schema = {
+    "season_name": pd.CategoricalDtype(ordered=True),
+    "season_start": "int16",
+    "total_points": "int16",
+    "rank": "Int32",
+    "team_id": "int32",
+    "team_name": "category",
+    "manager_name": "category",
+    "league_position": "int32",
+    "nationality": "category",
+    "favourite_team": "Int16",
+}
+
+
+def apply_season_schema(df):
+    """
+    Converts the columns of a season DataFrame to the compact season_schema types.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        A season history or current season DataFrame.
+
+    Returns
+    -------
+    df : pandas.DataFrame
+        The DataFrame with every season_schema column it contains converted.
+    """
+    dtypes = {
+        column: dtype for column, dtype in season_schema.items() if column in df.columns
+    }
+    df = df.astype(dtypes)
+    return df
+
 
 def summarise_season_current(
     league_data, team_data, manager_information, current_season_year, team_ids
@@ -86,6 +123,8 @@ def summarise_season_current(
 
     season_current_df = season_current_df[columns_to_output]
 
+    season_current_df = apply_season_schema(df=season_current_df)
+
     return season_current_df
 
 
@@ -95,8 +134,8 @@ def summarise_season_history(season_history):
 
     Parameters
     ----------
-    season_history : dict
-        Data about previous seasons.
+    season_history : dict or list
+        Data about previous seasons, as column arrays or a list of records.
 
     Returns
     -------
@@ -105,7 +144,13 @@ def summarise_season_history(season_history):
 
     """
     # Rank current season
-    season_history_df = pd.DataFrame.from_dict(season_history)
+    season_history_df = pd.DataFrame(season_history, copy=False)
+
+    # Start year of each season, e.g. 2019 for "2019/20", parsed once here so start
+    # year filters compare integers
+    season_history_df["season_start"] = (
+        season_history_df["season_name"].str[:4].astype(int)
+    )
 
     # Rank season data
     season_history_df["league_position"] = (
@@ -114,11 +159,11 @@ def summarise_season_history(season_history):
         .astype(dtype=int)
     )
 
-    season_history_df.sort_values(by=["season_name", "league_position"])
-
-    # Sort output
+    # Sort output, which also keeps season_start in order for filtering by start year
     season_history_df = season_history_df.sort_values(
-        ["season_name", "league_position"], ignore_index=True
+        ["season_start", "season_name", "league_position"], ignore_index=True
     )
 
+    season_history_df = apply_season_schema(df=season_history_df)
+
     return season_history_df
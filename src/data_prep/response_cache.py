@@ -0,0 +1,228 @@
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+import zlib
+
+# Location of the on-disk response cache, None to disable caching
+cache_path = ".cache/fpl_responses.sqlite"
+
+# Time to live in seconds for each API endpoint, matched in order against the URL.
+# "season" keeps a response while the game is in the season it was fetched in: the
+# past seasons in a manager's history never change, only the finished season is
+# appended once the game moves on to the next one.
+# bootstrap-static is not cached on disk, its in-process snapshot in load_data already
+# expires at the next gameweek deadline, and a disk copy would outlive it.
+cache_ttl = [
+    (r"/entry/\d+/history/", "season"),
+    (r"/entry/\d+/", 60 * 60),
+    (r"/leagues-classic/\d+/standings/", 5 * 60),
+]
+
+# The game's current season, e.g. "2024/25", from bootstrap-static. Responses kept for
+# the "season" are only served while it is the season they were fetched in
+current_season = None
+
+_connection = None
+_connection_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0}
+
+
+def get_connection():
+    """
+    Returns the shared SQLite connection to the response cache, creating it on first use.
+
+    Returns
+    -------
+    connection : sqlite3.Connection
+        The cache connection, shared between threads and guarded by _connection_lock.
+    """
+    global _connection
+
+    if _connection is None:
+        directory = os.path.dirname(cache_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        connection = sqlite3.connect(cache_path, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses "
+            "(url TEXT PRIMARY KEY, fetched_at REAL NOT NULL, body BLOB NOT NULL, "
+            "season TEXT)"
+        )
+        # Caches created before responses recorded their season
+        columns = [row[1] for row in connection.execute("PRAGMA table_info(responses)")]
+        if "season" not in columns:
+            connection.execute("ALTER TABLE responses ADD COLUMN season TEXT")
+        connection.commit()
+        _connection = connection
+
+    return _connection
+
+
+def set_current_season(season_name):
+    """
+    Records the game's current season, so responses kept for the "season" expire
+    as soon as the game moves on to the next one.
+
+    Parameters
+    ----------
+    season_name : str
+        The current season from bootstrap-static, e.g. "2024/25".
+    """
+    global current_season
+    current_season = season_name
+
+
+def get_ttl(url):
+    """
+    Returns the cache time to live policy for a URL.
+
+    Parameters
+    ----------
+    url : str
+        The API URL.
+
+    Returns
+    -------
+    ttl : int, str or None
+        Seconds to keep the response, "season" to keep it while the game is in the
+        same season, or None if the URL is not cached.
+    """
+    for pattern, ttl in cache_ttl:
+        if re.search(pattern, url):
+            return ttl
+    return None
+
+
+def is_fresh(ttl, fetched_at, season):
+    """
+    Checks whether a cached response is still within its time to live.
+
+    Parameters
+    ----------
+    ttl : int or str
+        The time to live policy for the response.
+    fetched_at : float
+        The Unix time the response was fetched.
+    season : str or None
+        The game's current season when the response was fetched.
+
+    Returns
+    -------
+    bool
+        True if the cached response can be used. "season" responses are never used
+        before the current season is known.
+    """
+    if ttl == "season":
+        return current_season is not None and season == current_season
+    return time.time() - fetched_at < ttl
+
+
+def get_cached_response(url):
+    """
+    Returns the cached JSON data for a URL if a fresh copy is on disk.
+
+    A cached body that can no longer be decoded is deleted and counted as a miss.
+
+    Parameters
+    ----------
+    url : str
+        The API URL.
+
+    Returns
+    -------
+    data : dict or None
+        The cached JSON data, or None on a cache miss or if the URL is not cached.
+    """
+    ttl = get_ttl(url)
+    if cache_path is None or ttl is None:
+        return None
+
+    with _connection_lock:
+        row = (
+            get_connection()
+            .execute(
+                "SELECT fetched_at, body, season FROM responses WHERE url = ?", (url,)
+            )
+            .fetchone()
+        )
+
+        if row is not None and is_fresh(ttl=ttl, fetched_at=row[0], season=row[2]):
+            _stats["hits"] += 1
+        else:
+            _stats["misses"] += 1
+            return None
+
+    try:
+        data = json.loads(zlib.decompress(row[1]))
+    except (zlib.error, ValueError):
+        with _connection_lock:
+            connection = get_connection()
+            connection.execute(
+                "DELETE FROM responses WHERE url = ? AND fetched_at = ?",
+                (url, row[0]),
+            )
+            connection.commit()
+            _stats["hits"] -= 1
+            _stats["misses"] += 1
+        return None
+
+    return data
+
+
+def set_cached_response(url, content):
+    """
+    Stores the raw JSON response body for a URL in the cache, with the game's current
+    season.
+
+    Parameters
+    ----------
+    url : str
+        The API URL.
+    content : bytes
+        The JSON response body.
+    """
+    if cache_path is None or get_ttl(url) is None:
+        return
+
+    body = zlib.compress(content)
+
+    with _connection_lock:
+        connection = get_connection()
+        connection.execute(
+            "INSERT OR REPLACE INTO responses (url, fetched_at, body, season) "
+            "VALUES (?, ?, ?, ?)",
+            (url, time.time(), body, current_season),
+        )
+        connection.commit()
+
+
+def get_cache_stats():
+    """
+    Returns the cache hit and miss counters for this process.
+
+    Returns
+    -------
+    stats : dict
+        The number of cache hits and misses.
+    """
+    with _connection_lock:
+        stats = dict(_stats)
+    return stats
+
+
+def clear_cache():
+    """
+    Removes every cached response and resets the hit and miss counters.
+    """
+    with _connection_lock:
+        connection = get_connection()
+        connection.execute("DELETE FROM responses")
+        connection.commit()
+        _stats["hits"] = 0
+        _stats["misses"] = 0
@@ -0,0 +1,91 @@
+import collections
+import concurrent.futures
+import threading
+import time
+
+
+class SingleFlightCache:
+    """
+    Memoizes values by key until they expire, collapsing concurrent loads of the same
+    key into a single call.
+
+    The first caller for a missing or expired key runs the loader. Callers arriving
+    while that load is in flight wait for its result instead of loading again.
+    Expired values are dropped rather than kept until their key is loaded again, and
+    given a limit, only that many of the most recently used values are kept.
+    """
+
+    def __init__(self, limit=None):
+        self._limit = limit
+        self._lock = threading.Lock()
+        self._values = collections.OrderedDict()
+        self._in_flight = {}
+
+    def get(self, key, load):
+        """
+        Returns the value for a key, loading it if it is missing or expired.
+
+        Parameters
+        ----------
+        key : hashable
+            The key to look up.
+        load : callable
+            Called with no arguments on a miss, returns a (value, expires_at) tuple
+            where expires_at is a Unix time.
+
+        Returns
+        -------
+        value : object
+            The memoized or freshly loaded value.
+        """
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is not None:
+                if entry[0] > time.time():
+                    self._values.move_to_end(key)
+                    return entry[1]
+                del self._values[key]
+
+            future = self._in_flight.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = concurrent.futures.Future()
+                self._in_flight[key] = future
+
+        if not is_leader:
+            return future.result()
+
+        try:
+            value, expires_at = load()
+        except BaseException as error:
+            with self._lock:
+                del self._in_flight[key]
+            future.set_exception(error)
+            raise
+
+        with self._lock:
+            now = time.time()
+            for expired_key in [
+                expired_key
+                for expired_key, (expired_at, _) in self._values.items()
+                if expired_at <= now
+            ]:
+                del self._values[expired_key]
+
+            # Values that have already expired (e.g. partial builds) are not kept
+            if expires_at > now:
+                self._values[key] = (expires_at, value)
+                self._values.move_to_end(key)
+                while self._limit is not None and len(self._values) > self._limit:
+                    self._values.popitem(last=False)
+            del self._in_flight[key]
+        future.set_result(value)
+
+        return value
+
+    def clear(self):
+        """
+        Removes every memoized value. Loads already in flight are unaffected.
+        """
+        with self._lock:
+            self._values.clear()
@@ -12,11 +12,15 @@ st.set_page_config(
 from src.app_utility.app_tools import (
     get_most_recent_august_start,
     remove_starting_the,
+    get_league_status_message,
+    get_team_labels,
 )
 from src.app_utility.create_output_tables import (
+    league_build_ttl,
     get_team_and_league_data,
     get_team_and_league_data_filtered_summarised,
 )
+from src.data_prep.output_league_seasons_history import get_team_comparison
 
 # Hide deploy button
 st.markdown(
@@ -35,6 +39,136 @@ st.markdown(
 latest_season_start = get_most_recent_august_start()
 
 
+class IncompleteLeagueBuild(Exception):
+    """
+    Carries a league build that ran out of time or is missing teams out of
+    get_league_build_cached, as Streamlit does not cache calls that raise.
+    """
+
+    def __init__(self, league_build):
+        super().__init__("The league build is incomplete")
+        self.league_build = league_build
+
+
+def is_league_build_complete(league_build):
+    """
+    Checks whether a league build finished in time with every team's data.
+
+    Parameters
+    ----------
+    league_build : tuple
+        The outputs of get_team_and_league_data.
+
+    Returns
+    -------
+    bool
+        False if the build ran out of time or is missing teams.
+    """
+    league_status = league_build[9]
+    return not (league_status["deadline_exceeded"] or league_status["missing_entries"])
+
+
+@st.cache_data(ttl=league_build_ttl, show_spinner=False)
+def get_league_build_cached(league_id):
+    """
+    Builds the data for a league, cached for every session by league ID.
+
+    Incomplete builds raise IncompleteLeagueBuild rather than being cached.
+
+    Parameters
+    ----------
+    league_id : int
+        The ID of the league.
+
+    Returns
+    -------
+    tuple
+        The outputs of get_team_and_league_data.
+    """
+    league_build = get_team_and_league_data(league_id=league_id)
+    if not is_league_build_complete(league_build=league_build):
+        raise IncompleteLeagueBuild(league_build=league_build)
+
+    return league_build
+
+
+@st.cache_data(ttl=league_build_ttl, show_spinner=False)
+def get_league_summary_cached(league_id, season_start_year, _league_build):
+    """
+    Summarises a league build from a start year, cached by league ID and start year.
+
+    Parameters
+    ----------
+    league_id : int
+        The ID of the league.
+    season_start_year : int
+        The start year of the seasons to include.
+    _league_build : tuple
+        The outputs of get_team_and_league_data for the league, not part of the key.
+
+    Returns
+    -------
+    tuple
+        The outputs of get_team_and_league_data_filtered_summarised.
+    """
+    return get_team_and_league_data_filtered_summarised(
+        league_build=_league_build, season_start_year=season_start_year
+    )
+
+
+def get_league_build(league_id):
+    """
+    Builds the data for a league, only fetching it if no cached build is fresh.
+
+    Builds that ran out of time or are missing teams are returned without being
+    cached, so the next build tries again.
+
+    Parameters
+    ----------
+    league_id : int
+        The ID of the league.
+
+    Returns
+    -------
+    tuple
+        The outputs of get_team_and_league_data.
+    """
+    try:
+        return get_league_build_cached(league_id=league_id)
+    except IncompleteLeagueBuild as incomplete:
+        return incomplete.league_build
+
+
+def get_league_summary(league_id, season_start_year, league_build):
+    """
+    Summarises a league build from a start year, caching only complete builds.
+
+    Parameters
+    ----------
+    league_id : int
+        The ID of the league.
+    season_start_year : int
+        The start year of the seasons to include.
+    league_build : tuple
+        The outputs of get_team_and_league_data for the league.
+
+    Returns
+    -------
+    tuple
+        The outputs of get_team_and_league_data_filtered_summarised.
+    """
+    if not is_league_build_complete(league_build=league_build):
+        return get_team_and_league_data_filtered_summarised(
+            league_build=league_build, season_start_year=season_start_year
+        )
+
+    return get_league_summary_cached(
+        league_id=league_id,
+        season_start_year=season_start_year,
+        _league_build=league_build,
+    )
+
+
 def main():
     try:
         st.title("FPL League History")
@@ -97,23 +231,30 @@ def main():
 
         # Button to trigger function execution
         if st.button("Generate League Data :soccer:"):
-            # Call your function with the input numbers
-
-            # Get data
-
             with st.spinner(text="Getting league data..."):
-                (
-                    league_data,
-                    manager_information,
-                    team_ids,
-                    final_gw_finished,
-                    season_history,
-                    season_current_df,
-                    season_history_df,
-                    current_gamekweek,
-                    team_data,
-                ) = get_team_and_league_data(league_id=int(league_id))
+                st.session_state["league_id"] = int(league_id)
+                st.session_state["league_build"] = get_league_build(
+                    league_id=int(league_id)
+                )
 
+        # Show the last league built in this session while its ID is entered, so
+        # reruns (e.g. changing the start year) reuse it rather than fetching again
+        if league_id is not None and st.session_state.get("league_id") == league_id:
+            league_build = st.session_state["league_build"]
+            (
+                league_data,
+                manager_information,
+                team_ids,
+                final_gw_finished,
+                season_history,
+                season_current_df,
+                season_history_df,
+                current_gamekweek,
+                team_data,
+                league_status,
+            ) = league_build
+
+            with st.spinner(text="Summarising league data..."):
                 (
                     league_name,
                     league_summary_kpis,
@@ -123,14 +264,10 @@ def main():
                     season_current_df_output,
                     season_history_df_output,
                     all_time_table_output,
-                ) = get_team_and_league_data_filtered_summarised(
-                    league_data=league_data,
-                    manager_information=manager_information,
-                    team_ids=team_ids,
-                    season_current_df=season_current_df,
-                    season_history_df=season_history_df,
+                ) = get_league_summary(
+                    league_id=league_id,
                     season_start_year=season_start_year,
-                    team_data=team_data,
+                    league_build=league_build,
                 )
 
             league_summary_kpis.reset_index(inplace=True)
@@ -139,6 +276,13 @@ def main():
             # Display the output tables
             st.header(league_name, divider="grey")
 
+            # Warn if the league data is incomplete
+            league_status_message = get_league_status_message(
+                league_status=league_status
+            )
+            if league_status_message:
+                st.warning(league_status_message)
+
             # Summary KPIs
             st.dataframe(data=league_summary_kpis, hide_index=True)
 
@@ -193,7 +337,24 @@ def main():
 
             # Team summary statistics
             st.subheader("Team Summary Statistics", divider="grey")
-            st.dataframe(season_overview_output.T, hide_index=True)
+            team_labels = get_team_labels(df=season_overview_output)
+            team_comparison_labels = st.multiselect(
+                "Compare teams",
+                options=team_labels.tolist(),
+                default=team_labels.iloc[:3].tolist(),
+                placeholder="Search for teams to compare",
+            )
+            team_ids_by_label = dict(zip(team_labels, team_labels.index))
+            st.dataframe(
+                get_team_comparison(
+                    df=season_overview_output,
+                    team_ids=[
+                        team_ids_by_label[label] for label in team_comparison_labels
+                    ],
+                ),
+                hide_index=True,
+            )
+            st.dataframe(season_overview_output, hide_index=True)
 
             # Current season
             if final_gw_finished: